@@ -37,6 +37,21 @@ std::optional<std::string> generate_pan(const std::string& prefix, int length);
  */
 std::vector<std::string> generate_pan_batch(const std::string& prefix, int length, int count);
 
+/**
+ * @brief Generates a batch of valid PANs as a single separator-joined string.
+ *
+ * Equivalent to joining the result of generate_pan_batch, but builds one
+ * preallocated buffer so the Python side receives a single str instead of
+ * a list of per-PAN objects.
+ *
+ * @param prefix The starting digits for all PANs in the batch.
+ * @param length The total desired length for each PAN.
+ * @param count The number of PANs to generate.
+ * @param sep The separator placed between consecutive PANs.
+ * @return The joined PANs. Empty if parameters are invalid.
+ */
+std::string generate_pan_batch_joined(const std::string& prefix, int length, int count, const std::string& sep);
+
 }
 
 #endif // FINTECHX_CORE_PAN_UTILS_HPP
@@ -52,6 +52,10 @@ PYBIND11_MODULE(fintechx_native, m) {
           "Generates a batch of valid PANs.",
           py::arg("prefix"), py::arg("length"), py::arg("count"));
 
+    m.def("generate_pan_batch_joined", &fintechx_core::generate_pan_batch_joined,
+          "Generates a batch of valid PANs joined by a separator into a single string.",
+          py::arg("prefix"), py::arg("length"), py::arg("count"), py::arg("sep") = "\n");
+
     // --- Encryption Utils Bindings --- 
     m.def("encrypt_aes_gcm", &fintechx_core::encrypt_aes_gcm, 
           "Encrypts plaintext using AES-256-GCM. Returns ciphertext + tag.",
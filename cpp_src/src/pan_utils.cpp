@@ -107,5 +107,24 @@ std::vector<std::string> generate_pan_batch(const std::string& prefix, int lengt
     return batch;
 }
 
+std::string generate_pan_batch_joined(const std::string& prefix, int length, int count, const std::string& sep) {
+    std::string joined;
+    if (count <= 0 || length <= 0 || prefix.length() >= static_cast<size_t>(length) || !is_digits(prefix)) {
+        return joined; // Return empty string for invalid input
+    }
+
+    joined.reserve(static_cast<size_t>(count) * (length + sep.length()));
+    for (int i = 0; i < count; ++i) {
+        std::optional<std::string> pan = generate_pan(prefix, length);
+        if (pan) {
+            if (!joined.empty()) {
+                joined += sep;
+            }
+            joined += *pan;
+        }
+    }
+    return joined;
+}
+
 }
 
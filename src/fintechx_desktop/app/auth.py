@@ -32,6 +32,20 @@ class Permission(Enum):
     FRAUD_MANAGEMENT = "fraud_management"
 
 
+# One bit per permission, so a set of permissions can be tested with a single AND
+PERMISSION_BITS = {permission: 1 << i for i, permission in enumerate(Permission)}
+
+# Permissions by stored value, so unknown values are skipped without raising
+PERM_BY_VALUE = {permission.value: permission for permission in Permission}
+
+
+def permissions_to_mask(permissions: Set[Permission]) -> int:
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
 class RolePermissions:
     DEFAULT_PERMISSIONS = {
         UserRole.ADMIN: {
@@ -101,6 +115,8 @@ class User:
         self.failed_login_attempts = 0
         self.locked_until = None
         self.active = True
+        self._search_key = None
+        self._search_text = ""
 
     @property
     def full_name(self) -> str:
@@ -108,6 +124,15 @@ class User:
             return f"{self.first_name} {self.last_name}".strip()
         return self.username
 
+    @property
+    def search_text(self) -> str:
+        # Lower-cased username and full name, rebuilt only when a name field changes
+        key = (self.username, self.first_name, self.last_name)
+        if key != self._search_key:
+            self._search_key = key
+            self._search_text = f"{self.username}\n{self.full_name}".lower()
+        return self._search_text
+
     @property
     def permissions(self) -> Set[Permission]:
         base_permissions = RolePermissions.get_permissions_for_role(self.role)
@@ -116,6 +141,11 @@ class User:
     def has_permission(self, permission: Permission) -> bool:
         return permission in self.permissions
 
+    @property
+    def permissions_mask(self) -> int:
+        # Derived on each read so it follows role and custom_permissions edits
+        return permissions_to_mask(self.permissions)
+
     def is_locked(self) -> bool:
         if not self.locked_until:
             return False
@@ -149,10 +179,9 @@ class User:
     def from_dict(cls, data: Dict) -> 'User':
         custom_permissions = set()
         for perm_str in data.get("custom_permissions", []):
-            try:
-                custom_permissions.add(Permission(perm_str))
-            except ValueError:
-                pass
+            permission = PERM_BY_VALUE.get(perm_str)
+            if permission is not None:
+                custom_permissions.add(permission)
 
         user = cls(
             username=data["username"],
@@ -192,6 +221,12 @@ class AuthManager:
         self.max_failed_attempts = 5
         self.lockout_duration = timedelta(minutes=15)
         self.session_timeout = timedelta(hours=8)
+        # Bumped on every change so callers can tell whether cached results are stale
+        self._rev = 0
+
+    @property
+    def revision(self) -> int:
+        return self._rev
 
     def create_user(
             self,
@@ -222,6 +257,7 @@ class AuthManager:
         )
 
         self.users[user.id] = user
+        self._rev += 1
         self.logger.info(f"Created user {user.id} with username {username}")
         return user.id
 
@@ -250,12 +286,14 @@ class AuthManager:
                 user.locked_until = datetime.now() + self.lockout_duration
                 self.logger.warning(f"User {username} locked due to too many failed login attempts")
 
+            self._rev += 1
             self.logger.warning(f"Failed authentication attempt for user: {username}")
             return None
 
         user.failed_login_attempts = 0
         user.last_login = datetime.now()
         user.updated_at = datetime.now()
+        self._rev += 1
 
         session_id = str(uuid.uuid4())
         self.active_sessions[session_id] = {
@@ -322,10 +360,11 @@ class AuthManager:
             elif key == "custom_permissions" and isinstance(value, list):
                 custom_permissions = set()
                 for perm_str in value:
-                    try:
-                        custom_permissions.add(Permission(perm_str))
-                    except ValueError:
+                    permission = PERM_BY_VALUE.get(perm_str)
+                    if permission is None:
                         self.logger.error(f"Invalid permission: {perm_str}")
+                        continue
+                    custom_permissions.add(permission)
                 user.custom_permissions = custom_permissions
             elif key == "password":
                 salt = os.urandom(32).hex()
@@ -336,6 +375,7 @@ class AuthManager:
                 setattr(user, key, value)
 
         user.updated_at = datetime.now()
+        self._rev += 1
         self.logger.info(f"Updated user {user_id}")
         return True
 
@@ -352,6 +392,7 @@ class AuthManager:
             for session_id in session_ids_to_remove:
                 del self.active_sessions[session_id]
 
+            self._rev += 1
             self.logger.info(f"Deleted user {user_id}")
             return True
 
@@ -381,6 +422,7 @@ class AuthManager:
         user.password_hash = password_hash
         user.salt = salt
         user.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Changed password for user {user_id}")
         return True
@@ -399,6 +441,7 @@ class AuthManager:
         user.failed_login_attempts = 0
         user.locked_until = None
         user.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Reset password for user {user_id}")
         return True
@@ -422,6 +465,7 @@ class AuthManager:
         for session_id in session_ids_to_remove:
             del self.active_sessions[session_id]
 
+        self._rev += 1
         self.logger.info(f"Locked user {user_id} for {lock_duration}")
         return True
 
@@ -434,6 +478,7 @@ class AuthManager:
         user.locked_until = None
         user.failed_login_attempts = 0
         user.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Unlocked user {user_id}")
         return True
@@ -446,6 +491,7 @@ class AuthManager:
 
         user.active = True
         user.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Activated user {user_id}")
         return True
@@ -468,6 +514,7 @@ class AuthManager:
         for session_id in session_ids_to_remove:
             del self.active_sessions[session_id]
 
+        self._rev += 1
         self.logger.info(f"Deactivated user {user_id}")
         return True
 
@@ -497,6 +544,7 @@ class AuthManager:
             if imported_users:
                 for user in imported_users:
                     self.users[user.id] = user
+                self._rev += 1
                 self.logger.info(f"Imported {len(imported_users)} users from {file_path}")
                 return True
             return False
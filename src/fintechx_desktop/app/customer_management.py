@@ -1,4 +1,5 @@
 import logging
+import threading
 import uuid
 from datetime import datetime
 from enum import Enum, auto
@@ -196,6 +197,9 @@ class CustomerManager:
         self.customers = {}
         self.accounts = {}
         self.logger = logging.getLogger("fintechx_desktop.app.customer_management")
+        # The UI applies writes from a worker thread while the GUI thread reads;
+        # anything that adds/removes entries or iterates the dicts holds this
+        self._lock = threading.RLock()
 
     def create_customer(
             self,
@@ -223,7 +227,8 @@ class CustomerManager:
             metadata=metadata
         )
 
-        self.customers[customer.id] = customer
+        with self._lock:
+            self.customers[customer.id] = customer
         self.logger.info(f"Created customer {customer.id}: {customer.full_name}")
         return customer.id
 
@@ -231,13 +236,16 @@ class CustomerManager:
         return self.customers.get(customer_id)
 
     def get_all_customers(self) -> List[Customer]:
-        return list(self.customers.values())
+        with self._lock:
+            return list(self.customers.values())
 
     def get_customers_by_status(self, status: CustomerStatus) -> List[Customer]:
-        return [c for c in self.customers.values() if c.status == status]
+        with self._lock:
+            return [c for c in self.customers.values() if c.status == status]
 
     def get_customers_by_type(self, customer_type: CustomerType) -> List[Customer]:
-        return [c for c in self.customers.values() if c.customer_type == customer_type]
+        with self._lock:
+            return [c for c in self.customers.values() if c.customer_type == customer_type]
 
     def update_customer(self, customer_id: str, updates: Dict) -> bool:
         customer = self.get_customer(customer_id)
@@ -272,15 +280,16 @@ class CustomerManager:
         return True
 
     def delete_customer(self, customer_id: str) -> bool:
-        if customer_id in self.customers:
-            # Delete associated accounts
-            accounts_to_delete = [a.id for a in self.accounts.values() if a.customer_id == customer_id]
-            for account_id in accounts_to_delete:
-                del self.accounts[account_id]
+        with self._lock:
+            if customer_id in self.customers:
+                # Delete associated accounts
+                accounts_to_delete = [a.id for a in self.accounts.values() if a.customer_id == customer_id]
+                for account_id in accounts_to_delete:
+                    del self.accounts[account_id]
 
-            del self.customers[customer_id]
-            self.logger.info(f"Deleted customer {customer_id}")
-            return True
+                del self.customers[customer_id]
+                self.logger.info(f"Deleted customer {customer_id}")
+                return True
 
         self.logger.warning(f"Attempted to delete non-existent customer: {customer_id}")
         return False
@@ -319,8 +328,9 @@ class CustomerManager:
             status=status
         )
 
-        self.accounts[account.id] = account
-        customer.accounts.append(account.id)
+        with self._lock:
+            self.accounts[account.id] = account
+            customer.accounts.append(account.id)
         customer.updated_at = datetime.now()
 
         self.logger.info(f"Created account {account.id} for customer {customer_id}")
@@ -330,7 +340,8 @@ class CustomerManager:
         return self.accounts.get(account_id)
 
     def get_customer_accounts(self, customer_id: str) -> List[Account]:
-        return [a for a in self.accounts.values() if a.customer_id == customer_id]
+        with self._lock:
+            return [a for a in self.accounts.values() if a.customer_id == customer_id]
 
     def update_account(self, account_id: str, updates: Dict) -> bool:
         account = self.get_account(account_id)
@@ -352,12 +363,13 @@ class CustomerManager:
             self.logger.warning(f"Attempted to delete non-existent account: {account_id}")
             return False
 
-        customer = self.get_customer(account.customer_id)
-        if customer and account_id in customer.accounts:
-            customer.accounts.remove(account_id)
-            customer.updated_at = datetime.now()
+        with self._lock:
+            customer = self.get_customer(account.customer_id)
+            if customer and account_id in customer.accounts:
+                customer.accounts.remove(account_id)
+                customer.updated_at = datetime.now()
 
-        del self.accounts[account_id]
+            self.accounts.pop(account_id, None)
         self.logger.info(f"Deleted account {account_id}")
         return True
 
@@ -365,7 +377,7 @@ class CustomerManager:
         query = query.lower()
         results = []
 
-        for customer in self.customers.values():
+        for customer in self.get_all_customers():
             if (query in customer.first_name.lower() or
                     query in customer.last_name.lower() or
                     query in customer.email.lower() or
@@ -377,13 +389,13 @@ class CustomerManager:
         return results
 
     def get_customer_by_email(self, email: str) -> Optional[Customer]:
-        for customer in self.customers.values():
+        for customer in self.get_all_customers():
             if customer.email.lower() == email.lower():
                 return customer
         return None
 
     def get_customer_by_tax_id(self, tax_id: str) -> Optional[Customer]:
-        for customer in self.customers.values():
+        for customer in self.get_all_customers():
             if customer.tax_id == tax_id:
                 return customer
         return None
@@ -417,7 +429,7 @@ class CustomerManager:
 
     def get_top_customers_by_volume(self, limit: int = 10) -> List[Customer]:
         sorted_customers = sorted(
-            self.customers.values(),
+            self.get_all_customers(),
             key=lambda c: c.total_transaction_volume,
             reverse=True
         )
@@ -425,7 +437,7 @@ class CustomerManager:
 
     def get_top_customers_by_count(self, limit: int = 10) -> List[Customer]:
         sorted_customers = sorted(
-            self.customers.values(),
+            self.get_all_customers(),
             key=lambda c: c.total_transaction_count,
             reverse=True
         )
@@ -1,3 +1,4 @@
+import heapq
 import logging
 import uuid
 from datetime import datetime
@@ -56,6 +57,10 @@ class Merchant:
         self.transaction_count = 0
         self.risk_score = 0
 
+    @property
+    def terminal_count(self) -> int:
+        return len(self.terminals)
+
     def to_dict(self) -> Dict:
         return {
             "id": self.id,
@@ -181,6 +186,12 @@ class MerchantManager:
         self.merchants = {}
         self.terminals = {}
         self.logger = logging.getLogger("fintechx_desktop.app.merchant_management")
+        # Bumped on every change so callers can tell whether cached results are stale
+        self._rev = 0
+
+    @property
+    def revision(self) -> int:
+        return self._rev
 
     def create_merchant(
             self,
@@ -205,6 +216,7 @@ class MerchantManager:
         )
 
         self.merchants[merchant.id] = merchant
+        self._rev += 1
         self.logger.info(f"Created merchant {merchant.id}: {name}")
         return merchant.id
 
@@ -243,6 +255,7 @@ class MerchantManager:
                 setattr(merchant, key, value)
 
         merchant.updated_at = datetime.now()
+        self._rev += 1
         self.logger.info(f"Updated merchant {merchant_id}")
         return True
 
@@ -254,6 +267,7 @@ class MerchantManager:
                 del self.terminals[terminal_id]
 
             del self.merchants[merchant_id]
+            self._rev += 1
             self.logger.info(f"Deleted merchant {merchant_id}")
             return True
 
@@ -268,6 +282,7 @@ class MerchantManager:
 
         merchant.status = status
         merchant.updated_at = datetime.now()
+        self._rev += 1
         self.logger.info(f"Changed status of merchant {merchant_id} to {status.value}")
         return True
 
@@ -297,6 +312,7 @@ class MerchantManager:
         self.terminals[terminal.id] = terminal
         merchant.terminals.append(terminal.id)
         merchant.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Added terminal {terminal.id} to merchant {merchant_id}")
         return terminal.id
@@ -318,6 +334,7 @@ class MerchantManager:
                 setattr(terminal, key, value)
 
         terminal.updated_at = datetime.now()
+        self._rev += 1
         self.logger.info(f"Updated terminal {terminal_id}")
         return True
 
@@ -333,22 +350,53 @@ class MerchantManager:
             merchant.updated_at = datetime.now()
 
         del self.terminals[terminal_id]
+        self._rev += 1
         self.logger.info(f"Deleted terminal {terminal_id}")
         return True
 
     def search_merchants(self, query: str) -> List[Merchant]:
         query = query.lower()
+        return [m for m in self.merchants.values() if self._matches_query(m, query)]
+
+    def list_merchants(
+            self,
+            *,
+            category: Optional[MerchantCategory] = None,
+            status: Optional[MerchantStatus] = None,
+            search: Optional[str] = None,
+            limit: Optional[int] = None,
+            offset: Optional[int] = None
+    ) -> List[Merchant]:
+        query = search.lower() if search else None
+        to_skip = offset or 0
         results = []
 
-        for merchant in self.merchants.values():
-            if (query in merchant.name.lower() or
-                    query in merchant.contact_email.lower() or
-                    query in merchant.address.lower() or
-                    query in merchant.tax_id.lower()):
-                results.append(merchant)
+        # Iterate over a snapshot; the UI fetches merchants from a worker thread
+        for merchant in list(self.merchants.values()):
+            if category is not None and merchant.category != category:
+                continue
+            if status is not None and merchant.status != status:
+                continue
+            if query and not self._matches_query(merchant, query):
+                continue
+
+            if to_skip:
+                to_skip -= 1
+                continue
+
+            results.append(merchant)
+            if limit is not None and len(results) >= limit:
+                break
 
         return results
 
+    @staticmethod
+    def _matches_query(merchant: Merchant, query: str) -> bool:
+        return (query in merchant.name.lower() or
+                query in merchant.contact_email.lower() or
+                query in merchant.address.lower() or
+                query in merchant.tax_id.lower())
+
     def get_merchant_by_name(self, name: str) -> Optional[Merchant]:
         for merchant in self.merchants.values():
             if merchant.name.lower() == name.lower():
@@ -370,6 +418,7 @@ class MerchantManager:
         merchant.transaction_volume += amount
         merchant.transaction_count += 1
         merchant.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Updated transaction stats for merchant {merchant_id}")
         return True
@@ -384,6 +433,7 @@ class MerchantManager:
         terminal.transaction_count += 1
         terminal.last_transaction = datetime.now()
         terminal.updated_at = datetime.now()
+        self._rev += 1
 
         self.logger.info(f"Updated transaction stats for terminal {terminal_id}")
         return True
@@ -403,3 +453,12 @@ class MerchantManager:
             reverse=True
         )
         return sorted_merchants[:limit]
+
+    def get_top_merchants(self, limit: int = 10) -> Dict[str, List[Merchant]]:
+        # Both rankings come from one snapshot; nlargest keeps only `limit`
+        # candidates instead of sorting every merchant twice
+        merchants = list(self.merchants.values())
+        return {
+            "volume": heapq.nlargest(limit, merchants, key=lambda m: m.transaction_volume),
+            "count": heapq.nlargest(limit, merchants, key=lambda m: m.transaction_count)
+        }
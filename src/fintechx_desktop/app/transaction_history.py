@@ -1,10 +1,26 @@
+import bisect
+import heapq
 import logging
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, time, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import uuid
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
 
 class TransactionType(Enum):
     PAYMENT = "Payment"
@@ -49,9 +65,24 @@ class Transaction:
         self.description = description
         self.reference_id = reference_id or f"TX-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         self.metadata = metadata or {}
+        self._indexed = False
         self.timestamp = datetime.now()
         self.updated_at = self.timestamp
 
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        # A TransactionHistory files the transaction under its day and time when
+        # it is added, so the timestamp is frozen from then on
+        if self._indexed:
+            raise AttributeError(f"Cannot change the timestamp of indexed transaction {self.id}")
+        self._timestamp = value
+        # Epoch seconds, kept in step for cheap numeric range checks
+        self._ts_epoch = value.timestamp()
+
     def _mask_card_number(self, card_number: str) -> str:
         if not card_number or len(card_number) < 13:
             return "Invalid Card"
@@ -91,17 +122,141 @@ class Transaction:
         return transaction
 
 
+_CREDIT_TYPES = frozenset([TransactionType.PAYMENT, TransactionType.CAPTURE])
+_DEBIT_TYPES = frozenset([TransactionType.REFUND, TransactionType.CHARGEBACK])
+
+
+def _signed_amount(transaction: Transaction) -> float:
+    if transaction.transaction_type in _CREDIT_TYPES:
+        return transaction.amount
+    if transaction.transaction_type in _DEBIT_TYPES:
+        return -transaction.amount
+    return 0
+
+
+class _Totals:
+    # Running aggregates over a set of transactions, e.g. those of one day
+
+    def __init__(self):
+        self.count = 0
+        self.volume = 0
+        self.by_type = Counter()
+        self.by_status = Counter()
+        self.by_merchant = {}
+
+    def add(self, transaction: Transaction) -> None:
+        amount = _signed_amount(transaction)
+        self.count += 1
+        self.volume += amount
+        self.by_type[transaction.transaction_type] += 1
+        self.by_status[transaction.status] += 1
+        self.by_merchant[transaction.merchant] = self.by_merchant.get(transaction.merchant, 0) + amount
+
+    def merge(self, other: '_Totals') -> None:
+        self.count += other.count
+        self.volume += other.volume
+        self.by_type.update(other.by_type)
+        self.by_status.update(other.by_status)
+        for merchant, volume in other.by_merchant.items():
+            self.by_merchant[merchant] = self.by_merchant.get(merchant, 0) + volume
+
+
 class TransactionManager:
     def __init__(self, storage_path: Optional[str] = None):
         self.transactions = []
         self.logger = logging.getLogger("fintechx_desktop.app.transaction_history")
         self.storage_path = storage_path
+        # Distinct merchant names; merchants_version is bumped whenever a new one appears
+        self.merchants = set()
+        self.merchants_version = 0
+        self._sorted_merchants = ((), 0)
+        # Exact-match indexes, each list kept in insertion order. Insertion
+        # order is keyed by object, as re-imported transactions repeat their ids
+        self._seq = {}
+        self._next_seq = 0
+        self._by_status = {}
+        self._by_type = {}
+        self._by_merchant = {}
+        # Timestamps in ascending order, paired with their transactions, for range
+        # lookups; after a bulk add they are stale until the next lookup re-sorts them
+        self._ts_sorted = []
+        self._by_ts = []
+        self._ts_stale = False
+        # Aggregates for all transactions and per calendar day, plus finished
+        # reports by date range; the cache is dropped whenever anything changes
+        self._totals = _Totals()
+        self._day_totals = {}
+        self._report_cache = {}
+
+    def _track_merchant(self, merchant: str) -> None:
+        if merchant not in self.merchants:
+            self.merchants.add(merchant)
+            self.merchants_version += 1
+
+    def sorted_merchants(self) -> tuple:
+        # Re-sorted only when a new merchant has appeared since the last call
+        merchants, version = self._sorted_merchants
+        if version != self.merchants_version:
+            merchants = tuple(sorted(self.merchants))
+            self._sorted_merchants = (merchants, self.merchants_version)
+        return merchants
+
+    def _index_transaction(self, transaction: Transaction) -> None:
+        transaction._indexed = True
+        self._seq[id(transaction)] = self._next_seq
+        self._next_seq += 1
+        self._by_status.setdefault(transaction.status, []).append(transaction)
+        self._by_type.setdefault(transaction.transaction_type, []).append(transaction)
+        self._by_merchant.setdefault(transaction.merchant, []).append(transaction)
+        self._track_merchant(transaction.merchant)
+
+        self._totals.add(transaction)
+        day = transaction.timestamp.date()
+        if day not in self._day_totals:
+            self._day_totals[day] = _Totals()
+        self._day_totals[day].add(transaction)
+        self._report_cache.clear()
+
+    def _seq_of(self, transaction: Transaction) -> int:
+        return self._seq[id(transaction)]
+
+    def _index_timestamp(self, transaction: Transaction) -> None:
+        if self._ts_stale:
+            return
+        pos = bisect.bisect_right(self._ts_sorted, transaction._ts_epoch)
+        self._ts_sorted.insert(pos, transaction._ts_epoch)
+        self._by_ts.insert(pos, transaction)
+
+    def _rebuild_timestamp_index(self) -> None:
+        # The sort is stable, so equal timestamps stay in insertion order
+        self._by_ts = sorted(self.transactions, key=lambda t: t._ts_epoch)
+        self._ts_sorted = [t._ts_epoch for t in self._by_ts]
+        self._ts_stale = False
+
+    def _in_date_range(self, start_date: datetime, end_date: datetime) -> List[Transaction]:
+        if self._ts_stale:
+            self._rebuild_timestamp_index()
+        lo = bisect.bisect_left(self._ts_sorted, start_date.timestamp())
+        hi = bisect.bisect_right(self._ts_sorted, end_date.timestamp())
+        return self._by_ts[lo:hi]
 
     def add_transaction(self, transaction: Transaction) -> str:
         self.transactions.append(transaction)
+        self._index_transaction(transaction)
+        self._index_timestamp(transaction)
         self.logger.info(f"Added transaction {transaction.id} for {transaction.amount:.2f} at {transaction.merchant}")
         return transaction.id
 
+    def bulk_add(self, transactions: List[Transaction]) -> int:
+        # The time index is only marked stale, so a run of bulk adds (such as a
+        # chunked import) pays for a single re-sort at the next range lookup
+        self.transactions.extend(transactions)
+        for transaction in transactions:
+            self._index_transaction(transaction)
+        self._ts_stale = True
+        self.logger.info(f"Added {len(transactions)} transactions")
+        return len(transactions)
+
     def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
         for transaction in self.transactions:
             if transaction.id == transaction_id:
@@ -114,6 +269,14 @@ class TransactionManager:
             self.logger.warning(f"Attempted to update non-existent transaction: {transaction_id}")
             return False
 
+        self._by_status[transaction.status].remove(transaction)
+        bisect.insort(self._by_status.setdefault(new_status, []), transaction, key=self._seq_of)
+
+        for totals in (self._totals, self._day_totals[transaction.timestamp.date()]):
+            totals.by_status[transaction.status] -= 1
+            totals.by_status[new_status] += 1
+        self._report_cache.clear()
+
         transaction.status = new_status
         transaction.updated_at = datetime.now()
         self.logger.info(f"Updated transaction {transaction_id} status to {new_status.value}")
@@ -129,10 +292,8 @@ class TransactionManager:
         return [t for t in self.transactions if t.status == status]
 
     def get_transactions_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Transaction]:
-        return [
-            t for t in self.transactions
-            if start_date <= t.timestamp <= end_date
-        ]
+        # Returned oldest first
+        return self._in_date_range(start_date, end_date)
 
     def get_transactions_by_merchant(self, merchant: str) -> List[Transaction]:
         return [t for t in self.transactions if merchant.lower() in t.merchant.lower()]
@@ -140,6 +301,65 @@ class TransactionManager:
     def get_transactions_by_type(self, transaction_type: TransactionType) -> List[Transaction]:
         return [t for t in self.transactions if t.transaction_type == transaction_type]
 
+    def query(
+            self,
+            start_date: datetime,
+            end_date: datetime,
+            status: Optional[TransactionStatus] = None,
+            transaction_type: Optional[TransactionType] = None,
+            merchant: Optional[str] = None
+    ) -> List[Transaction]:
+        # Start from the smallest index that applies, then check the rest in one pass
+        pools = {"date": self._in_date_range(start_date, end_date)}
+        if status is not None:
+            pools["status"] = self._by_status.get(status, [])
+        if transaction_type is not None:
+            pools["type"] = self._by_type.get(transaction_type, [])
+
+        needle = merchant.lower() if merchant else None
+        if needle:
+            matching = [ts for name, ts in self._by_merchant.items() if needle in name.lower()]
+            pools["merchant"] = list(heapq.merge(*matching, key=self._seq_of))
+
+        chosen = min(pools, key=lambda name: len(pools[name]))
+        predicate = self._build_predicate(
+            start_date.timestamp() if chosen != "date" else None,
+            end_date.timestamp(),
+            status if chosen != "status" else None,
+            transaction_type if chosen != "type" else None,
+            needle if chosen != "merchant" else None
+        )
+        result = list(filter(predicate, pools[chosen])) if predicate else list(pools[chosen])
+
+        # The date index is in time order; keep results in insertion order like the others
+        if chosen == "date":
+            result.sort(key=self._seq_of)
+        return result
+
+    @staticmethod
+    def _build_predicate(lo, hi, status, transaction_type, needle):
+        # Fuse only the active checks into one function; a filter left at "all"
+        # costs nothing per transaction. The clause text is fixed, and filter
+        # values reach the function only through its namespace.
+        clauses = []
+        namespace = {}
+        if lo is not None:
+            clauses.append("lo <= t._ts_epoch <= hi")
+            namespace.update(lo=lo, hi=hi)
+        if status is not None:
+            clauses.append("t.status is status")
+            namespace["status"] = status
+        if transaction_type is not None:
+            clauses.append("t.transaction_type is transaction_type")
+            namespace["transaction_type"] = transaction_type
+        if needle is not None:
+            clauses.append("needle in t.merchant.lower()")
+            namespace["needle"] = needle
+
+        if not clauses:
+            return None
+        return eval(f"lambda t: {' and '.join(clauses)}", namespace)
+
     def get_transaction_volume_by_date(self, start_date: datetime, end_date: datetime) -> Dict[str, float]:
         transactions = self.get_transactions_by_date_range(start_date, end_date)
         result = {}
@@ -157,53 +377,45 @@ class TransactionManager:
         return result
 
     def get_transaction_count_by_status(self) -> Dict[str, int]:
-        result = {status.value: 0 for status in TransactionStatus}
-
-        for transaction in self.transactions:
-            result[transaction.status.value] += 1
-
-        return result
+        return {status.value: self._totals.by_status[status] for status in TransactionStatus}
 
     def get_transaction_volume_by_merchant(self, top_n: int = 5) -> Dict[str, float]:
-        result = {}
-
-        for transaction in self.transactions:
-            if transaction.merchant not in result:
-                result[transaction.merchant] = 0
-
-            if transaction.transaction_type in [TransactionType.PAYMENT, TransactionType.CAPTURE]:
-                result[transaction.merchant] += transaction.amount
-            elif transaction.transaction_type in [TransactionType.REFUND, TransactionType.CHARGEBACK]:
-                result[transaction.merchant] -= transaction.amount
-
-        sorted_merchants = sorted(result.items(), key=lambda x: abs(x[1]), reverse=True)
+        sorted_merchants = sorted(self._totals.by_merchant.items(), key=lambda x: abs(x[1]), reverse=True)
         return dict(sorted_merchants[:top_n])
 
     def export_to_json(self, file_path: str) -> bool:
         try:
-            with open(file_path, 'w') as f:
-                json.dump([t.to_dict() for t in self.transactions], f, indent=2)
+            # Written one transaction at a time so the export never sits in memory whole
+            with open(file_path, 'wb') as f:
+                f.write(b'[')
+                for i, transaction in enumerate(self.transactions):
+                    if i:
+                        f.write(b',\n')
+                    f.write(_dumps(transaction.to_dict()))
+                f.write(b']\n')
             self.logger.info(f"Exported {len(self.transactions)} transactions to {file_path}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to export transactions: {e}")
             return False
 
+    def iter_json_transactions(self, file_path: str) -> Iterator[Transaction]:
+        # Reads the file without touching the manager, so it is safe off the GUI thread
+        with open(file_path, 'rb') as f:
+            data = _loads(f.read())
+
+        for item in data:
+            try:
+                yield Transaction.from_dict(item)
+            except Exception as e:
+                self.logger.error(f"Failed to import transaction: {e}")
+
     def import_from_json(self, file_path: str) -> bool:
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-
-            imported_transactions = []
-            for item in data:
-                try:
-                    transaction = Transaction.from_dict(item)
-                    imported_transactions.append(transaction)
-                except Exception as e:
-                    self.logger.error(f"Failed to import transaction: {e}")
+            imported_transactions = list(self.iter_json_transactions(file_path))
 
             if imported_transactions:
-                self.transactions.extend(imported_transactions)
+                self.bulk_add(imported_transactions)
                 self.logger.info(f"Imported {len(imported_transactions)} transactions from {file_path}")
                 return True
             return False
@@ -211,10 +423,45 @@ class TransactionManager:
             self.logger.error(f"Failed to import transactions: {e}")
             return False
 
+    def _totals_for_range(self, start_date: datetime, end_date: datetime) -> _Totals:
+        first_day = start_date.date()
+        last_day = end_date.date()
+
+        # Days wholly inside the range come from their running totals; only
+        # a partially covered first or last day is scanned
+        full_from = first_day if start_date == datetime.combine(first_day, time.min) else first_day + timedelta(days=1)
+        full_to = last_day if end_date == datetime.combine(last_day, time.max) else last_day - timedelta(days=1)
+
+        totals = _Totals()
+        if full_from > full_to:
+            for transaction in self._in_date_range(start_date, end_date):
+                totals.add(transaction)
+            return totals
+
+        for day, day_totals in self._day_totals.items():
+            if full_from <= day <= full_to:
+                totals.merge(day_totals)
+
+        if full_from != first_day:
+            for transaction in self._in_date_range(start_date, datetime.combine(first_day, time.max)):
+                totals.add(transaction)
+        if full_to != last_day:
+            for transaction in self._in_date_range(datetime.combine(last_day, time.min), end_date):
+                totals.add(transaction)
+        return totals
+
     def generate_transaction_report(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        transactions = self.get_transactions_by_date_range(start_date, end_date)
+        key = (start_date, end_date)
+        report = self._report_cache.get(key)
+        if report is None:
+            report = self._build_transaction_report(start_date, end_date)
+            self._report_cache[key] = report
+        return report
+
+    def _build_transaction_report(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        totals = self._totals_for_range(start_date, end_date)
 
-        if not transactions:
+        if not totals.count:
             return {
                 "period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
                 "total_count": 0,
@@ -222,35 +469,13 @@ class TransactionManager:
                 "message": "No transactions found for the specified period"
             }
 
-        total_volume = 0
-        type_counts = {t.value: 0 for t in TransactionType}
-        status_counts = {s.value: 0 for s in TransactionStatus}
-        merchant_volumes = {}
-
-        for transaction in transactions:
-            if transaction.transaction_type in [TransactionType.PAYMENT, TransactionType.CAPTURE]:
-                total_volume += transaction.amount
-            elif transaction.transaction_type in [TransactionType.REFUND, TransactionType.CHARGEBACK]:
-                total_volume -= transaction.amount
-
-            type_counts[transaction.transaction_type.value] += 1
-            status_counts[transaction.status.value] += 1
-
-            if transaction.merchant not in merchant_volumes:
-                merchant_volumes[transaction.merchant] = 0
-
-            if transaction.transaction_type in [TransactionType.PAYMENT, TransactionType.CAPTURE]:
-                merchant_volumes[transaction.merchant] += transaction.amount
-            elif transaction.transaction_type in [TransactionType.REFUND, TransactionType.CHARGEBACK]:
-                merchant_volumes[transaction.merchant] -= transaction.amount
-
-        top_merchants = sorted(merchant_volumes.items(), key=lambda x: abs(x[1]), reverse=True)[:5]
+        top_merchants = sorted(totals.by_merchant.items(), key=lambda x: abs(x[1]), reverse=True)[:5]
 
         return {
             "period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
-            "total_count": len(transactions),
-            "total_volume": total_volume,
-            "type_distribution": type_counts,
-            "status_distribution": status_counts,
+            "total_count": totals.count,
+            "total_volume": totals.volume,
+            "type_distribution": {t.value: totals.by_type[t] for t in TransactionType},
+            "status_distribution": {s.value: totals.by_status[s] for s in TransactionStatus},
             "top_merchants": dict(top_merchants)
         }
@@ -1,15 +1,21 @@
 import logging
 from datetime import datetime
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, QPushButton, QLabel,
     QTableWidget, QTableWidgetItem, QComboBox, QLineEdit, QHeaderView, QTextEdit,
-    QMessageBox, QTabWidget, QDialog, QDialogButtonBox, QCheckBox, QDateEdit
+    QMessageBox, QTabWidget, QDialog, QDialogButtonBox, QCheckBox, QDateEdit, QMainWindow
 )
-from PyQt6.QtCore import pyqtSlot
+from PyQt6 import sip
+from PyQt6.QtCore import QThreadPool, pyqtSlot
 from PyQt6.QtGui import QColor
 
 from ..app.customer_management import (CustomerType, CustomerStatus,
 )
+from .tasks import ManagerTask
+
+_ACTIVE = CustomerStatus.ACTIVE
+_SUSPENDED = CustomerStatus.SUSPENDED
 
 
 class CustomerDetailsDialog(QDialog):
@@ -320,6 +326,9 @@ class CustomerManagementWidget(QWidget):
         super().__init__(parent)
         self.customer_manager = customer_manager
         self.logger = logging.getLogger("fintechx_desktop.ui.customer_management")
+        # Writes run one at a time, in the order they were requested
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
 
         main_layout = QVBoxLayout(self)
 
@@ -588,12 +597,12 @@ class CustomerManagementWidget(QWidget):
             edit_button.setProperty("customer_id", customer.id)
             edit_button.clicked.connect(self.edit_customer)
 
-            if customer.status == CustomerStatus.ACTIVE:
+            if customer.status is _ACTIVE:
                 suspend_button = QPushButton("Suspend")
                 suspend_button.setProperty("customer_id", customer.id)
                 suspend_button.clicked.connect(self.suspend_customer)
                 actions_layout.addWidget(suspend_button)
-            elif customer.status == CustomerStatus.SUSPENDED:
+            elif customer.status is _SUSPENDED:
                 activate_button = QPushButton("Activate")
                 activate_button.setProperty("customer_id", customer.id)
                 activate_button.clicked.connect(self.activate_customer)
@@ -702,6 +711,31 @@ class CustomerManagementWidget(QWidget):
             self.count_table.setItem(row, 1, QTableWidgetItem(customer.customer_type.value))
             self.count_table.setItem(row, 2, QTableWidgetItem(str(customer.total_transaction_count)))
 
+    def _show_status(self, message):
+        # Non-blocking confirmation in the main window's status bar; fall back
+        # to a message box when the widget is not hosted in a QMainWindow.
+        window = self.window()
+        if isinstance(window, QMainWindow):
+            window.statusBar().showMessage(message, 3000)
+        else:
+            QMessageBox.information(self, "Success", message)
+
+    def _start_write(self, button, fn, on_done):
+        # Keep the triggering button disabled until its write has been applied
+        if button is not None:
+            button.setEnabled(False)
+
+        task = ManagerTask(fn)
+        task.signals.finished.connect(partial(self._on_write_done, button, on_done))
+        self._write_pool.start(task)
+
+    def _on_write_done(self, button, on_done, ok, result):
+        if button is not None and not sip.isdeleted(button):
+            button.setEnabled(True)
+        if not ok:
+            self.logger.error(f"Customer manager call failed: {result!r}", exc_info=result)
+        on_done(ok, result)
+
     @pyqtSlot()
     def add_new_customer(self):
         dialog = CustomerDetailsDialog(self.customer_manager, parent=self)
@@ -766,29 +800,20 @@ class CustomerManagementWidget(QWidget):
         if dialog.exec():
             customer_data = dialog.get_customer_data()
 
-            updates = {
-                "first_name": customer_data["first_name"],
-                "last_name": customer_data["last_name"],
-                "email": customer_data["email"],
-                "phone": customer_data["phone"],
-                "address": customer_data["address"],
-                "customer_type": customer_data["customer_type"].value,
-                "status": customer_data["status"].value,
-                "tax_id": customer_data["tax_id"],
-                "date_of_birth": customer_data["date_of_birth"].isoformat(),
-                "metadata": customer_data["metadata"],
-                "kyc_verified": customer_data["kyc_verified"],
-                "risk_score": customer_data["risk_score"]
-            }
-
-            success = self.customer_manager.update_customer(customer_id, updates)
-
-            if success:
-                QMessageBox.information(self, "Success", "Customer updated successfully.")
-                self.refresh_customers_table()
-                self.refresh_customer_combo()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to update customer.")
+            self._start_write(
+                button,
+                lambda: self.customer_manager.update_customer(customer_id, customer_data),
+                self._on_update_customer_done
+            )
+
+    @pyqtSlot(bool, object)
+    def _on_update_customer_done(self, ok, success):
+        if ok and success:
+            self._show_status("Customer updated successfully.")
+            self.refresh_customers_table()
+            self.refresh_customer_combo()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to update customer.")
 
     @pyqtSlot()
     def suspend_customer(self):
@@ -803,29 +828,42 @@ class CustomerManagementWidget(QWidget):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            success = self.customer_manager.change_customer_status(customer_id, CustomerStatus.SUSPENDED)
+            self._start_write(
+                button,
+                lambda: self.customer_manager.change_customer_status(customer_id, _SUSPENDED),
+                self._on_suspend_customer_done
+            )
 
-            if success:
-                QMessageBox.information(self, "Success", "Customer suspended successfully.")
-                self.refresh_customers_table()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to suspend customer.")
+    @pyqtSlot(bool, object)
+    def _on_suspend_customer_done(self, ok, success):
+        if ok and success:
+            self._show_status("Customer suspended successfully.")
+            self.refresh_customers_table()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to suspend customer.")
 
     @pyqtSlot()
     def activate_customer(self):
         button = self.sender()
         customer_id = button.property("customer_id")
 
-        success = self.customer_manager.change_customer_status(customer_id, CustomerStatus.ACTIVE)
+        self._start_write(
+            button,
+            lambda: self.customer_manager.change_customer_status(customer_id, _ACTIVE),
+            self._on_activate_customer_done
+        )
 
-        if success:
-            QMessageBox.information(self, "Success", "Customer activated successfully.")
+    @pyqtSlot(bool, object)
+    def _on_activate_customer_done(self, ok, success):
+        if ok and success:
+            self._show_status("Customer activated successfully.")
             self.refresh_customers_table()
         else:
             QMessageBox.warning(self, "Error", "Failed to activate customer.")
 
     @pyqtSlot()
     def add_new_account(self):
+        button = self.sender()
         customer_id = self.customer_combo.currentData()
         if not customer_id:
             QMessageBox.warning(self, "Error", "Please select a customer first.")
@@ -835,25 +873,33 @@ class CustomerManagementWidget(QWidget):
         if dialog.exec():
             account_data = dialog.get_account_data()
 
-            account_id = self.customer_manager.create_account(
-                customer_id=customer_id,
-                account_number=account_data["account_number"],
-                account_type=account_data["account_type"],
-                balance=account_data["balance"],
-                currency=account_data["currency"],
-                status=account_data["status"]
-            )
-
-            if account_id:
-                account = self.customer_manager.get_account(account_id)
-                if account:
-                    account.overdraft_limit = account_data["overdraft_limit"]
-                    account.interest_rate = account_data["interest_rate"]
-
-                QMessageBox.information(self, "Success", "Account added successfully.")
-                self.refresh_accounts_table()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to add account.")
+            def create():
+                account_id = self.customer_manager.create_account(
+                    customer_id=customer_id,
+                    account_number=account_data["account_number"],
+                    account_type=account_data["account_type"],
+                    balance=account_data["balance"],
+                    currency=account_data["currency"],
+                    status=account_data["status"]
+                )
+
+                if account_id:
+                    account = self.customer_manager.get_account(account_id)
+                    if account:
+                        account.overdraft_limit = account_data["overdraft_limit"]
+                        account.interest_rate = account_data["interest_rate"]
+
+                return account_id
+
+            self._start_write(button, create, self._on_create_account_done)
+
+    @pyqtSlot(bool, object)
+    def _on_create_account_done(self, ok, account_id):
+        if ok and account_id:
+            self._show_status("Account added successfully.")
+            self.refresh_accounts_table()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to add account.")
 
     @pyqtSlot()
     def edit_account(self):
@@ -869,23 +915,19 @@ class CustomerManagementWidget(QWidget):
         if dialog.exec():
             account_data = dialog.get_account_data()
 
-            updates = {
-                "account_number": account_data["account_number"],
-                "account_type": account_data["account_type"],
-                "balance": account_data["balance"],
-                "currency": account_data["currency"],
-                "status": account_data["status"],
-                "overdraft_limit": account_data["overdraft_limit"],
-                "interest_rate": account_data["interest_rate"]
-            }
-
-            success = self.customer_manager.update_account(account_id, updates)
-
-            if success:
-                QMessageBox.information(self, "Success", "Account updated successfully.")
-                self.refresh_accounts_table()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to update account.")
+            self._start_write(
+                button,
+                lambda: self.customer_manager.update_account(account_id, account_data),
+                self._on_update_account_done
+            )
+
+    @pyqtSlot(bool, object)
+    def _on_update_account_done(self, ok, success):
+        if ok and success:
+            self._show_status("Account updated successfully.")
+            self.refresh_accounts_table()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to update account.")
 
     @pyqtSlot()
     def delete_account(self):
@@ -900,10 +942,16 @@ class CustomerManagementWidget(QWidget):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            success = self.customer_manager.delete_account(account_id)
+            self._start_write(
+                button,
+                lambda: self.customer_manager.delete_account(account_id),
+                self._on_delete_account_done
+            )
 
-            if success:
-                QMessageBox.information(self, "Success", "Account deleted successfully.")
-                self.refresh_accounts_table()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to delete account.")
+    @pyqtSlot(bool, object)
+    def _on_delete_account_done(self, ok, success):
+        if ok and success:
+            self._show_status("Account deleted successfully.")
+            self.refresh_accounts_table()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to delete account.")
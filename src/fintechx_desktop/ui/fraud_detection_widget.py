@@ -8,9 +8,23 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSlot
 
 from ..app.fraud_detection import FraudDetectionEngine, FraudRiskLevel
+from .table_utils import batch_update
+
+_HIGH = FraudRiskLevel.HIGH
+_MEDIUM = FraudRiskLevel.MEDIUM
 
 
 class FraudDetectionWidget(QWidget):
+    _DETAILS_TEMPLATE = (
+        "ID: {id}\n"
+        "Amount: ${amount:.2f}\n"
+        "Merchant: {merchant}\n"
+        "Country: {country}\n"
+        "Description: {description}\n"
+        "Card ID: {card_id}\n"
+        "Timestamp: {ts}"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger("fintechx_desktop.ui.fraud_detection")
@@ -84,25 +98,21 @@ class FraudDetectionWidget(QWidget):
 
     @pyqtSlot()
     def evaluate_transaction(self):
+        now = datetime.now()
         transaction = {
-            'id': f"T-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            'id': f"T-{now.strftime('%Y%m%d%H%M%S')}",
             'amount': self.amount_input.value(),
             'merchant': self.merchant_input.text(),
             'country': self.country_input.currentText(),
             'description': self.description_input.text(),
             'card_id': self.card_id_input.text(),
-            'timestamp': datetime.now()
+            'timestamp': now
         }
 
-        self.transaction_details.setText(
-            f"ID: {transaction['id']}\n"
-            f"Amount: ${transaction['amount']:.2f}\n"
-            f"Merchant: {transaction['merchant']}\n"
-            f"Country: {transaction['country']}\n"
-            f"Description: {transaction['description']}\n"
-            f"Card ID: {transaction['card_id']}\n"
-            f"Timestamp: {transaction['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+        self.transaction_details.setPlainText(self._DETAILS_TEMPLATE.format(
+            ts=transaction['timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+            **transaction
+        ))
 
         results = self.fraud_engine.evaluate_transaction(transaction)
 
@@ -116,18 +126,19 @@ class FraudDetectionWidget(QWidget):
         self.status_label.setText(f"Transaction flagged by {len(results)} rule(s)")
         self.status_label.setStyleSheet("color: red;")
 
-        self.results_table.setRowCount(len(results))
+        with batch_update(self.results_table) as tbl:
+            tbl.setRowCount(len(results))
 
-        for row, result in enumerate(results):
-            self.results_table.setItem(row, 0, QTableWidgetItem(result["rule_name"]))
+            for row, result in enumerate(results):
+                tbl.setItem(row, 0, QTableWidgetItem(result["rule_name"]))
 
-            risk_item = QTableWidgetItem(result["risk_level"].name)
-            if result["risk_level"] == FraudRiskLevel.HIGH:
-                risk_item.setBackground(Qt.GlobalColor.red)
-            elif result["risk_level"] == FraudRiskLevel.MEDIUM:
-                risk_item.setBackground(Qt.GlobalColor.yellow)
-            else:
-                risk_item.setBackground(Qt.GlobalColor.green)
+                risk_item = QTableWidgetItem(result["risk_level"].name)
+                if result["risk_level"] is _HIGH:
+                    risk_item.setBackground(Qt.GlobalColor.red)
+                elif result["risk_level"] is _MEDIUM:
+                    risk_item.setBackground(Qt.GlobalColor.yellow)
+                else:
+                    risk_item.setBackground(Qt.GlobalColor.green)
 
-            self.results_table.setItem(row, 1, risk_item)
-            self.results_table.setItem(row, 2, QTableWidgetItem(result["message"]))
+                tbl.setItem(row, 1, risk_item)
+                tbl.setItem(row, 2, QTableWidgetItem(result["message"]))
@@ -18,7 +18,7 @@ from .customer_management_widget import CustomerManagementWidget
 from .batch_processing_widget import BatchProcessingWidget
 
 # Import the app modules
-from ..app.auth import AuthManager, UserRole, Permission
+from ..app.auth import AuthManager, UserRole, Permission, PERMISSION_BITS
 from ..app.merchant_management import MerchantManager
 from ..app.customer_management import CustomerManager
 
@@ -113,6 +113,9 @@ class PanToolsWidget(QWidget):
             if count == 1:
                 pan = fintechx_native.generate_pan(prefix, length)
                 self.generated_pans_output.setText(pan if pan else "Failed to generate PAN.")
+            elif hasattr(fintechx_native, "generate_pan_batch_joined"):
+                pans = fintechx_native.generate_pan_batch_joined(prefix, length, count, "\n")
+                self.generated_pans_output.setPlainText(pans if pans else "Failed to generate PAN batch.")
             else:
                 pans = fintechx_native.generate_pan_batch(prefix, length, count)
                 self.generated_pans_output.setText("\n".join(pans) if pans else "Failed to generate PAN batch.")
@@ -123,6 +126,12 @@ class PanToolsWidget(QWidget):
 
 # --- Main Window ---
 class MainWindow(QMainWindow):
+    ADMIN_MASK = (
+            PERMISSION_BITS[Permission.MANAGE_USERS] |
+            PERMISSION_BITS[Permission.MANAGE_MERCHANTS] |
+            PERMISSION_BITS[Permission.MANAGE_CUSTOMERS]
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FinTechX Desktop")
@@ -273,11 +282,7 @@ class MainWindow(QMainWindow):
             return
 
         # Show/hide admin menu based on permissions
-        has_admin_permission = (
-                self.current_user.has_permission(Permission.MANAGE_USERS) or
-                self.current_user.has_permission(Permission.MANAGE_MERCHANTS) or
-                self.current_user.has_permission(Permission.MANAGE_CUSTOMERS)
-        )
+        has_admin_permission = bool(self.current_user.permissions_mask & self.ADMIN_MASK)
         self.admin_menu.menuAction().setVisible(has_admin_permission)
 
     @pyqtSlot()
@@ -1,14 +1,160 @@
 import logging
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QComboBox, QLineEdit, QHeaderView, QTextEdit,
-    QMessageBox, QTabWidget, QDialog, QDialogButtonBox
+    QTableWidget, QComboBox, QLineEdit, QHeaderView, QTextEdit,
+    QMessageBox, QTabWidget, QDialog, QDialogButtonBox, QTableView
 )
-from PyQt6.QtCore import pyqtSlot
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QCoreApplication, QModelIndex, QObject, QSignalBlocker,
+    QThread, QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QBrush, QColor
 
 from ..app.merchant_management import ( MerchantCategory, MerchantStatus
 )
+from .table_utils import ActionDelegate, batch_update, set_cell
+
+LIGHT_GREEN = QColor(200, 255, 200)
+LIGHT_YELLOW = QColor(255, 255, 200)
+LIGHT_RED = QColor(255, 200, 200)
+LIGHT_GRAY = QColor(200, 200, 200)
+
+# Status backgrounds are shared brushes so cells never allocate their own
+_STATUS_BRUSH = {
+    MerchantStatus.ACTIVE: QBrush(LIGHT_GREEN),
+    MerchantStatus.PENDING: QBrush(LIGHT_YELLOW),
+    MerchantStatus.SUSPENDED: QBrush(LIGHT_RED),
+    MerchantStatus.TERMINATED: QBrush(LIGHT_GRAY),
+}
+
+_TERMINAL_ACTIVE_BRUSH = QBrush(LIGHT_GREEN)
+_TERMINAL_INACTIVE_BRUSH = QBrush(LIGHT_RED)
+_TERMINAL_MAINTENANCE_BRUSH = QBrush(LIGHT_YELLOW)
+
+_TERMINAL_STATUS_BRUSH = {
+    "Active": _TERMINAL_ACTIVE_BRUSH,
+    "Inactive": _TERMINAL_INACTIVE_BRUSH,
+    "Maintenance": _TERMINAL_MAINTENANCE_BRUSH,
+}
+
+_NO_BRUSH = QBrush()
+
+# Enum display strings, looked up once instead of through .value per cell
+CATEGORY_VALUE = {category: category.value for category in MerchantCategory}
+STATUS_VALUE = {status: status.value for status in MerchantStatus}
+
+
+def _sync_rows(table, row_ids, records, fill_row):
+    """Bring ``table`` in line with ``records`` without rebuilding unchanged rows.
+
+    ``row_ids`` holds the id shown on each row and is updated in place. Rows
+    whose record is gone are removed bottom-up, new records get a row inserted
+    at their position, and ``fill_row(row, record)`` refreshes cells.
+    """
+    keep = {record.id for record in records}
+    for row in range(len(row_ids) - 1, -1, -1):
+        if row_ids[row] not in keep:
+            table.removeRow(row)
+            del row_ids[row]
+
+    for row, record in enumerate(records):
+        if row >= len(row_ids) or row_ids[row] != record.id:
+            table.insertRow(row)
+            row_ids.insert(row, record.id)
+        fill_row(row, record)
+
+    # Rows left over from a reordering are duplicates of ones already placed
+    for row in range(len(row_ids) - 1, len(records) - 1, -1):
+        table.removeRow(row)
+        del row_ids[row]
+
+
+class MerchantTableModel(QAbstractTableModel):
+    """Exposes a page of merchants to a QTableView; cells are produced on demand."""
+
+    HEADERS = ["Name", "Category", "Contact", "Status", "Terminals", "Transaction Volume", "Actions"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._merchants = []
+        self._display_rows = {}
+
+    def set_merchants(self, merchants):
+        self.beginResetModel()
+        self._merchants = list(merchants)
+        self._display_rows = {}
+        self.endResetModel()
+
+    def merchant_at(self, row):
+        return self._merchants[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._merchants)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def _display_row(self, row):
+        # A row's text is formatted once and reused for every later repaint
+        cells = self._display_rows.get(row)
+        if cells is None:
+            merchant = self._merchants[row]
+            cells = (
+                merchant.name,
+                CATEGORY_VALUE[merchant.category],
+                merchant.contact_email + "\n" + merchant.contact_phone,
+                STATUS_VALUE[merchant.status],
+                str(merchant.terminal_count),
+                "$%.2f" % merchant.transaction_volume,
+                None
+            )
+            self._display_rows[row] = cells
+        return cells
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        merchant = self._merchants[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_row(index.row())[column]
+        elif role == Qt.ItemDataRole.BackgroundRole and column == 3:
+            return _STATUS_BRUSH.get(merchant.status)
+        elif role == Qt.ItemDataRole.UserRole:
+            return merchant.id
+
+        return None
+
+
+class MerchantFetcher(QObject):
+    """Runs merchant queries on a worker thread.
+
+    ``fetched`` carries the request number back with the results so the
+    widget can drop answers to requests it has since superseded.
+    """
+
+    fetched = pyqtSignal(int, list)
+
+    def __init__(self, merchant_manager):
+        super().__init__()
+        self.merchant_manager = merchant_manager
+
+    @pyqtSlot(int, dict)
+    def fetch(self, request, filters):
+        self.fetched.emit(request, self.merchant_manager.list_merchants(**filters))
+
+
+def _stop_thread(thread):
+    thread.quit()
+    thread.wait()
 
 
 class MerchantDetailsDialog(QDialog):
@@ -16,6 +162,7 @@ class MerchantDetailsDialog(QDialog):
         super().__init__(parent)
         self.merchant_manager = merchant_manager
         self.merchant = merchant
+        self._validated = None
         self.setWindowTitle("Merchant Details" if merchant else "Add New Merchant")
         self.setMinimumWidth(600)
         self.setup_ui()
@@ -31,7 +178,7 @@ class MerchantDetailsDialog(QDialog):
 
         self.category_combo = QComboBox()
         for category in MerchantCategory:
-            self.category_combo.addItem(category.value)
+            self.category_combo.addItem(category.value, category)
         form_layout.addRow("Category:", self.category_combo)
 
         self.email_input = QLineEdit()
@@ -49,7 +196,7 @@ class MerchantDetailsDialog(QDialog):
 
         self.status_combo = QComboBox()
         for status in MerchantStatus:
-            self.status_combo.addItem(status.value)
+            self.status_combo.addItem(status.value, status)
         form_layout.addRow("Status:", self.status_combo)
 
         # Additional metadata
@@ -145,46 +292,31 @@ class MerchantDetailsDialog(QDialog):
             QMessageBox.warning(self, "Input Error", "Address is required.")
             return
 
-        self.accept()
-
-    def get_merchant_data(self):
-        category = None
-        for c in MerchantCategory:
-            if c.value == self.category_combo.currentText():
-                category = c
-                break
-
-        status = None
-        for s in MerchantStatus:
-            if s.value == self.status_combo.currentText():
-                status = s
-                break
-
-        metadata = {
-            "website": self.website_input.text().strip(),
-            "contact_name": self.contact_name_input.text().strip(),
-            "notes": self.notes_input.toPlainText().strip()
-        }
-
-        settlement_info = {
-            "bank_name": self.bank_name_input.text().strip(),
-            "account_number": self.account_number_input.text().strip(),
-            "routing_number": self.routing_number_input.text().strip()
-        }
-
-        data = {
-            "name": self.name_input.text().strip(),
-            "category": category,
-            "contact_email": self.email_input.text().strip(),
-            "contact_phone": self.phone_input.text().strip(),
-            "address": self.address_input.toPlainText().strip(),
+        # Capture the submitted values once; get_merchant_data hands them back
+        self._validated = {
+            "name": name,
+            "category": self.category_combo.currentData(),
+            "contact_email": email,
+            "contact_phone": phone,
+            "address": address,
             "tax_id": self.tax_id_input.text().strip(),
-            "status": status,
-            "metadata": metadata,
-            "settlement_info": settlement_info
+            "status": self.status_combo.currentData(),
+            "metadata": {
+                "website": self.website_input.text().strip(),
+                "contact_name": self.contact_name_input.text().strip(),
+                "notes": self.notes_input.toPlainText().strip()
+            },
+            "settlement_info": {
+                "bank_name": self.bank_name_input.text().strip(),
+                "account_number": self.account_number_input.text().strip(),
+                "routing_number": self.routing_number_input.text().strip()
+            }
         }
 
-        return data
+        self.accept()
+
+    def get_merchant_data(self):
+        return self._validated
 
 
 class TerminalDetailsDialog(QDialog):
@@ -271,10 +403,49 @@ class TerminalDetailsDialog(QDialog):
 
 
 class MerchantManagementWidget(QWidget):
+    requestFetch = pyqtSignal(int, dict)
+
     def __init__(self, merchant_manager, parent=None):
         super().__init__(parent)
         self.merchant_manager = merchant_manager
         self.logger = logging.getLogger("fintechx_desktop.ui.merchant_management")
+        self._terminal_row_ids = []
+        self._page_size = 100
+        self._page_offset = 0
+        self._fetch_request = 0
+
+        # Keys (manager revision plus query) of what each view currently shows;
+        # a refresh with an unchanged key is skipped
+        self._merchants_cache_key = None
+        self._pending_merchants_key = None
+        self._terminals_cache_key = None
+        self._analytics_cache_rev = -1
+        self._merchant_combo_rev = -1
+        self._merchant_combo_ids = []
+
+        # Merchant queries run on a worker thread and report back through a queued signal
+        self._fetch_thread = QThread(self)
+        self._fetcher = MerchantFetcher(merchant_manager)
+        self._fetcher.moveToThread(self._fetch_thread)
+        self.requestFetch.connect(self._fetcher.fetch)
+        self._fetcher.fetched.connect(self._populate_merchants_table, Qt.ConnectionType.QueuedConnection)
+        self._fetch_thread.finished.connect(self._fetcher.deleteLater)
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_fetch_thread)
+        # destroyed is emitted before the widget's children, the thread among
+        # them, are deleted; bind the thread rather than the dying widget
+        self.destroyed.connect(partial(_stop_thread, self._fetch_thread))
+        self._fetch_thread.start()
+
+        # Coalesce bursts of filter edits and merchant selection changes into one refresh
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.refresh_merchants_table)
+
+        self._terminals_timer = QTimer(self)
+        self._terminals_timer.setSingleShot(True)
+        self._terminals_timer.setInterval(150)
+        self._terminals_timer.timeout.connect(self.refresh_terminals_table)
 
         main_layout = QVBoxLayout(self)
 
@@ -286,16 +457,15 @@ class MerchantManagementWidget(QWidget):
         self.setup_merchants_list_tab()
         self.tab_widget.addTab(self.merchants_list_widget, "Merchants")
 
-        # Create the terminals tab
+        # The terminals and analytics tabs start empty and are filled in on first visit
         self.terminals_widget = QWidget()
-        self.setup_terminals_tab()
         self.tab_widget.addTab(self.terminals_widget, "Terminals")
 
-        # Create the analytics tab
         self.analytics_widget = QWidget()
-        self.setup_analytics_tab()
         self.tab_widget.addTab(self.analytics_widget, "Analytics")
 
+        self._tabs_built = {0: True, 1: False, 2: False}
+
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
@@ -310,20 +480,24 @@ class MerchantManagementWidget(QWidget):
         filter_layout = QHBoxLayout()
 
         self.category_filter = QComboBox()
-        self.category_filter.addItem("All Categories")
+        self.category_filter.addItem("All Categories", None)
         for category in MerchantCategory:
-            self.category_filter.addItem(category.value)
+            self.category_filter.addItem(category.value, category)
 
         self.status_filter = QComboBox()
-        self.status_filter.addItem("All Statuses")
+        self.status_filter.addItem("All Statuses", None)
         for status in MerchantStatus:
-            self.status_filter.addItem(status.value)
+            self.status_filter.addItem(status.value, status)
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search merchants...")
 
         self.apply_filter_button = QPushButton("Apply Filter")
-        self.apply_filter_button.clicked.connect(self.refresh_merchants_table)
+        self.apply_filter_button.clicked.connect(self._schedule_merchants_refresh)
+
+        self.category_filter.currentIndexChanged.connect(self._schedule_merchants_refresh)
+        self.status_filter.currentIndexChanged.connect(self._schedule_merchants_refresh)
+        self.search_input.textChanged.connect(self._schedule_merchants_refresh)
 
         filter_layout.addWidget(QLabel("Category:"))
         filter_layout.addWidget(self.category_filter)
@@ -334,13 +508,29 @@ class MerchantManagementWidget(QWidget):
         filter_layout.addWidget(self.apply_filter_button)
         filter_group.setLayout(filter_layout)
 
-        # Merchants table
-        self.merchants_table = QTableWidget(0, 7)
-        self.merchants_table.setHorizontalHeaderLabels([
-            "Name", "Category", "Contact", "Status", "Terminals", "Transaction Volume", "Actions"
-        ])
-        self.merchants_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Merchants table, backed by a model holding one page of merchants
+        self.merchants_model = MerchantTableModel(self)
+        self.merchants_table = QTableView()
+        self.merchants_table.setModel(self.merchants_model)
+        self.merchants_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.merchants_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
+        self.merchant_actions_delegate = ActionDelegate(self._merchant_actions, self.merchants_table)
+        self.merchants_table.setItemDelegateForColumn(6, self.merchant_actions_delegate)
+
+        # Paging controls
+        page_layout = QHBoxLayout()
+        self.prev_page_button = QPushButton("Previous")
+        self.prev_page_button.clicked.connect(self.show_previous_page)
+
+        self.page_label = QLabel()
+
+        self.next_page_button = QPushButton("Next")
+        self.next_page_button.clicked.connect(self.show_next_page)
+
+        page_layout.addStretch()
+        page_layout.addWidget(self.prev_page_button)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.next_page_button)
 
         # Action buttons
         action_layout = QHBoxLayout()
@@ -355,6 +545,7 @@ class MerchantManagementWidget(QWidget):
 
         layout.addWidget(filter_group)
         layout.addWidget(self.merchants_table)
+        layout.addLayout(page_layout)
         layout.addLayout(action_layout)
 
         self.merchants_list_widget.setLayout(layout)
@@ -370,6 +561,7 @@ class MerchantManagementWidget(QWidget):
         merchant_layout = QHBoxLayout()
 
         self.merchant_combo = QComboBox()
+        self.merchant_combo.addItem("Select a merchant...")
         self.refresh_merchant_combo()
 
         self.refresh_merchant_combo_button = QPushButton("Refresh")
@@ -385,8 +577,10 @@ class MerchantManagementWidget(QWidget):
         self.terminals_table.setHorizontalHeaderLabels([
             "Name", "Type", "Location", "Status", "Transaction Count", "Actions"
         ])
-        self.terminals_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.terminals_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.terminals_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        self.terminal_actions_delegate = ActionDelegate(self._terminal_actions, self.terminals_table)
+        self.terminals_table.setItemDelegateForColumn(5, self.terminal_actions_delegate)
 
         # Action buttons
         action_layout = QHBoxLayout()
@@ -406,7 +600,7 @@ class MerchantManagementWidget(QWidget):
         self.terminals_widget.setLayout(layout)
 
         # Connect merchant selection change
-        self.merchant_combo.currentIndexChanged.connect(self.refresh_terminals_table)
+        self.merchant_combo.currentIndexChanged.connect(self._schedule_terminals_refresh)
 
     def setup_analytics_tab(self):
         layout = QVBoxLayout()
@@ -447,197 +641,212 @@ class MerchantManagementWidget(QWidget):
 
         self.analytics_widget.setLayout(layout)
 
+    def _ensure_tab_built(self, index):
+        if self._tabs_built[index]:
+            return
+
+        if index == 1:
+            self.setup_terminals_tab()
+        elif index == 2:
+            self.setup_analytics_tab()
+        self._tabs_built[index] = True
+
     @pyqtSlot(int)
     def on_tab_changed(self, index):
+        self._ensure_tab_built(index)
+
         if index == 0:  # Merchants tab
             self.refresh_merchants_table()
         elif index == 1:  # Terminals tab
+            # Both are no-ops unless the merchant data has changed since the last visit
             self.refresh_merchant_combo()
             self.refresh_terminals_table()
         elif index == 2:  # Analytics tab
             self.refresh_analytics()
 
+    @pyqtSlot()
+    def _schedule_merchants_refresh(self):
+        # A new filter starts again from the first page
+        self._page_offset = 0
+        self._filter_timer.start()
+
+    @pyqtSlot()
+    def show_previous_page(self):
+        self._page_offset = max(0, self._page_offset - self._page_size)
+        self.refresh_merchants_table()
+
+    @pyqtSlot()
+    def show_next_page(self):
+        self._page_offset += self._page_size
+        self.refresh_merchants_table()
+
+    @pyqtSlot()
+    def _schedule_terminals_refresh(self):
+        self._terminals_timer.start()
+
+    @pyqtSlot()
+    def _stop_fetch_thread(self):
+        _stop_thread(self._fetch_thread)
+
     @pyqtSlot()
     def refresh_merchants_table(self):
-        self.merchants_table.setRowCount(0)
+        search_text = self.search_input.text().strip()
+
+        # Fetch one extra row to learn whether a next page exists
+        filters = {
+            "category": self.category_filter.currentData(),
+            "status": self.status_filter.currentData(),
+            "search": search_text or None,
+            "limit": self._page_size + 1,
+            "offset": self._page_offset
+        }
+
+        key = (self.merchant_manager.revision, tuple(filters.items()))
+        self._fetch_request += 1
+        if key == self._merchants_cache_key:
+            # The table already shows this; just drop any fetch still in flight
+            return
 
-        category_filter = self.category_filter.currentText()
-        status_filter = self.status_filter.currentText()
-        search_text = self.search_input.text().strip().lower()
+        self._pending_merchants_key = key
+        self.requestFetch.emit(self._fetch_request, filters)
 
-        merchants = self.merchant_manager.get_all_merchants()
+    @pyqtSlot(int, list)
+    def _populate_merchants_table(self, request, merchants):
+        # A newer request is already on its way
+        if request != self._fetch_request:
+            return
+
+        # The current page may have emptied out, e.g. after its last merchant changed status
+        if not merchants and self._page_offset:
+            self._page_offset = max(0, self._page_offset - self._page_size)
+            self.refresh_merchants_table()
+            return
+
+        self._merchants_cache_key = self._pending_merchants_key
+        has_next_page = len(merchants) > self._page_size
+        merchants = merchants[:self._page_size]
+
+        self.merchants_model.set_merchants(merchants)
+
+        first = self._page_offset + 1 if merchants else 0
+        self.page_label.setText(f"{first}-{self._page_offset + len(merchants)}")
+        self.prev_page_button.setEnabled(self._page_offset > 0)
+        self.next_page_button.setEnabled(has_next_page)
 
-        # Apply category filter
-        if category_filter != "All Categories":
-            category = None
-            for c in MerchantCategory:
-                if c.value == category_filter:
-                    category = c
-                    break
-            if category:
-                merchants = [m for m in merchants if m.category == category]
-
-        # Apply status filter
-        if status_filter != "All Statuses":
-            status = None
-            for s in MerchantStatus:
-                if s.value == status_filter:
-                    status = s
-                    break
-            if status:
-                merchants = [m for m in merchants if m.status == status]
-
-        # Apply search filter
-        if search_text:
-            merchants = self.merchant_manager.search_merchants(search_text)
-
-        self.merchants_table.setRowCount(len(merchants))
-
-        for row, merchant in enumerate(merchants):
-            self.merchants_table.setItem(row, 0, QTableWidgetItem(merchant.name))
-            self.merchants_table.setItem(row, 1, QTableWidgetItem(merchant.category.value))
-
-            contact_info = f"{merchant.contact_email}\n{merchant.contact_phone}"
-            self.merchants_table.setItem(row, 2, QTableWidgetItem(contact_info))
-
-            status_item = QTableWidgetItem(merchant.status.value)
-            if merchant.status == MerchantStatus.ACTIVE:
-                status_item.setBackground(QColor(200, 255, 200))  # Light green
-            elif merchant.status == MerchantStatus.PENDING:
-                status_item.setBackground(QColor(255, 255, 200))  # Light yellow
-            elif merchant.status == MerchantStatus.SUSPENDED:
-                status_item.setBackground(QColor(255, 200, 200))  # Light red
-            elif merchant.status == MerchantStatus.TERMINATED:
-                status_item.setBackground(QColor(200, 200, 200))  # Light gray
-
-            self.merchants_table.setItem(row, 3, status_item)
-
-            terminal_count = len(merchant.terminals)
-            self.merchants_table.setItem(row, 4, QTableWidgetItem(str(terminal_count)))
-
-            volume_item = QTableWidgetItem(f"${merchant.transaction_volume:.2f}")
-            self.merchants_table.setItem(row, 5, volume_item)
-
-            # Action buttons in a widget
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-
-            view_button = QPushButton("View")
-            view_button.setProperty("merchant_id", merchant.id)
-            view_button.clicked.connect(self.view_merchant)
-
-            edit_button = QPushButton("Edit")
-            edit_button.setProperty("merchant_id", merchant.id)
-            edit_button.clicked.connect(self.edit_merchant)
-
-            if merchant.status == MerchantStatus.ACTIVE:
-                suspend_button = QPushButton("Suspend")
-                suspend_button.setProperty("merchant_id", merchant.id)
-                suspend_button.clicked.connect(self.suspend_merchant)
-                actions_layout.addWidget(suspend_button)
-            elif merchant.status == MerchantStatus.SUSPENDED:
-                activate_button = QPushButton("Activate")
-                activate_button.setProperty("merchant_id", merchant.id)
-                activate_button.clicked.connect(self.activate_merchant)
-                actions_layout.addWidget(activate_button)
-
-            actions_layout.addWidget(view_button)
-            actions_layout.addWidget(edit_button)
-
-            self.merchants_table.setCellWidget(row, 6, actions_widget)
+        self.merchants_table.resizeColumnsToContents()
 
     @pyqtSlot()
     def refresh_merchant_combo(self):
-        current_text = self.merchant_combo.currentText()
-
-        self.merchant_combo.clear()
-        self.merchant_combo.addItem("Select a merchant...")
+        revision = self.merchant_manager.revision
+        if revision == self._merchant_combo_rev:
+            return
+        self._merchant_combo_rev = revision
 
+        combo = self.merchant_combo
+        ids = self._merchant_combo_ids
+        current_id = combo.currentData()
         merchants = self.merchant_manager.get_all_merchants()
-        for merchant in merchants:
-            self.merchant_combo.addItem(merchant.name, merchant.id)
 
-        # Try to restore previous selection
-        if current_text:
-            index = self.merchant_combo.findText(current_text)
-            if index >= 0:
-                self.merchant_combo.setCurrentIndex(index)
+        # Edit the existing items in place (row 0 is the placeholder) without
+        # letting each change fire currentIndexChanged
+        with QSignalBlocker(combo):
+            keep = {merchant.id for merchant in merchants}
+            for pos in range(len(ids) - 1, -1, -1):
+                if ids[pos] not in keep:
+                    combo.removeItem(pos + 1)
+                    del ids[pos]
 
-    @pyqtSlot()
-    def refresh_terminals_table(self):
-        self.terminals_table.setRowCount(0)
+            for pos, merchant in enumerate(merchants):
+                if pos >= len(ids) or ids[pos] != merchant.id:
+                    combo.insertItem(pos + 1, merchant.name, merchant.id)
+                    ids.insert(pos, merchant.id)
+                elif combo.itemText(pos + 1) != merchant.name:
+                    combo.setItemText(pos + 1, merchant.name)
 
-        merchant_id = self.merchant_combo.currentData()
-        if not merchant_id:
-            return
+            for pos in range(len(ids) - 1, len(merchants) - 1, -1):
+                combo.removeItem(pos + 1)
+                del ids[pos]
+
+            # Restore the previous selection by id, falling back to the placeholder
+            combo.setCurrentIndex(max(combo.findData(current_id), 0) if current_id else 0)
 
-        terminals = self.merchant_manager.get_merchant_terminals(merchant_id)
+        if combo.currentData() != current_id:
+            self._schedule_terminals_refresh()
 
-        self.terminals_table.setRowCount(len(terminals))
+    @pyqtSlot()
+    def refresh_terminals_table(self):
+        merchant_id = self.merchant_combo.currentData()
 
-        for row, terminal in enumerate(terminals):
-            self.terminals_table.setItem(row, 0, QTableWidgetItem(terminal.name))
-            self.terminals_table.setItem(row, 1, QTableWidgetItem(terminal.terminal_type))
-            self.terminals_table.setItem(row, 2, QTableWidgetItem(terminal.location))
+        key = (self.merchant_manager.revision, merchant_id)
+        if key == self._terminals_cache_key:
+            return
+        self._terminals_cache_key = key
 
-            status_item = QTableWidgetItem(terminal.status)
-            if terminal.status == "Active":
-                status_item.setBackground(QColor(200, 255, 200))  # Light green
-            elif terminal.status == "Inactive":
-                status_item.setBackground(QColor(255, 200, 200))  # Light red
-            elif terminal.status == "Maintenance":
-                status_item.setBackground(QColor(255, 255, 200))  # Light yellow
+        terminals = self.merchant_manager.get_merchant_terminals(merchant_id) if merchant_id else []
 
-            self.terminals_table.setItem(row, 3, status_item)
+        with batch_update(self.terminals_table):
+            _sync_rows(self.terminals_table, self._terminal_row_ids, terminals, self._fill_terminal_row)
 
-            self.terminals_table.setItem(row, 4, QTableWidgetItem(str(terminal.transaction_count)))
+        self.terminals_table.resizeColumnsToContents()
 
-            # Action buttons in a widget
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
+    def _fill_terminal_row(self, row, terminal):
+        table = self.terminals_table
+        set_cell(table, row, 0, terminal.name).setData(Qt.ItemDataRole.UserRole, terminal.id)
+        set_cell(table, row, 1, terminal.terminal_type)
+        set_cell(table, row, 2, terminal.location)
 
-            edit_button = QPushButton("Edit")
-            edit_button.setProperty("terminal_id", terminal.id)
-            edit_button.clicked.connect(self.edit_terminal)
+        status_item = set_cell(table, row, 3, terminal.status)
+        status_item.setBackground(_TERMINAL_STATUS_BRUSH.get(terminal.status, _NO_BRUSH))
 
-            delete_button = QPushButton("Delete")
-            delete_button.setProperty("terminal_id", terminal.id)
-            delete_button.clicked.connect(self.delete_terminal)
+        set_cell(table, row, 4, str(terminal.transaction_count))
 
-            actions_layout.addWidget(edit_button)
-            actions_layout.addWidget(delete_button)
+    def _merchant_actions(self, index):
+        merchant = self.merchants_model.merchant_at(index.row())
+        actions = []
+        if merchant.status == MerchantStatus.ACTIVE:
+            actions.append(("Suspend", self.suspend_merchant))
+        elif merchant.status == MerchantStatus.SUSPENDED:
+            actions.append(("Activate", self.activate_merchant))
+        actions.append(("View", self.view_merchant))
+        actions.append(("Edit", self.edit_merchant))
+        return actions
 
-            self.terminals_table.setCellWidget(row, 5, actions_widget)
+    def _terminal_actions(self, index):
+        return [("Edit", self.edit_terminal), ("Delete", self.delete_terminal)]
 
     @pyqtSlot()
     def refresh_analytics(self):
-        # Top merchants by volume
-        self.volume_table.setRowCount(0)
+        # The top lists only move when merchants or their stats change
+        revision = self.merchant_manager.revision
+        if revision == self._analytics_cache_rev:
+            return
+        self._analytics_cache_rev = revision
 
-        top_volume_merchants = self.merchant_manager.get_top_merchants_by_volume(10)
+        top_merchants = self.merchant_manager.get_top_merchants(10)
 
-        self.volume_table.setRowCount(len(top_volume_merchants))
+        # Top merchants by volume
+        top_volume_merchants = top_merchants["volume"]
 
-        for row, merchant in enumerate(top_volume_merchants):
-            self.volume_table.setItem(row, 0, QTableWidgetItem(merchant.name))
-            self.volume_table.setItem(row, 1, QTableWidgetItem(merchant.category.value))
+        table = self.volume_table
+        with batch_update(table):
+            table.setRowCount(len(top_volume_merchants))
 
-            volume_item = QTableWidgetItem(f"${merchant.transaction_volume:.2f}")
-            self.volume_table.setItem(row, 2, volume_item)
+            for row, merchant in enumerate(top_volume_merchants):
+                set_cell(table, row, 0, merchant.name)
+                set_cell(table, row, 1, CATEGORY_VALUE[merchant.category])
+                set_cell(table, row, 2, "$%.2f" % merchant.transaction_volume)
 
         # Top merchants by count
-        self.count_table.setRowCount(0)
-
-        top_count_merchants = self.merchant_manager.get_top_merchants_by_count(10)
+        top_count_merchants = top_merchants["count"]
 
-        self.count_table.setRowCount(len(top_count_merchants))
+        table = self.count_table
+        with batch_update(table):
+            table.setRowCount(len(top_count_merchants))
 
-        for row, merchant in enumerate(top_count_merchants):
-            self.count_table.setItem(row, 0, QTableWidgetItem(merchant.name))
-            self.count_table.setItem(row, 1, QTableWidgetItem(merchant.category.value))
-            self.count_table.setItem(row, 2, QTableWidgetItem(str(merchant.transaction_count)))
+            for row, merchant in enumerate(top_count_merchants):
+                set_cell(table, row, 0, merchant.name)
+                set_cell(table, row, 1, CATEGORY_VALUE[merchant.category])
+                set_cell(table, row, 2, str(merchant.transaction_count))
 
     @pyqtSlot()
     def add_new_merchant(self):
@@ -663,34 +872,27 @@ class MerchantManagementWidget(QWidget):
 
                 QMessageBox.information(self, "Success", "Merchant created successfully.")
                 self.refresh_merchants_table()
-                self.refresh_merchant_combo()
             else:
                 QMessageBox.warning(self, "Error", "Failed to create merchant.")
 
-    @pyqtSlot()
-    def view_merchant(self):
-        button = self.sender()
-        merchant_id = button.property("merchant_id")
-
+    def view_merchant(self, merchant_id):
         merchant = self.merchant_manager.get_merchant(merchant_id)
         if not merchant:
             QMessageBox.warning(self, "Error", "Merchant not found.")
             return
 
-        # Find the merchant in the combo box and select it
-        for i in range(self.merchant_combo.count()):
-            if self.merchant_combo.itemData(i) == merchant_id:
-                self.merchant_combo.setCurrentIndex(i)
-                break
+        # Find the merchant in the combo box and select it; the combo only
+        # catches up with merchant changes when it is needed
+        self._ensure_tab_built(1)
+        self.refresh_merchant_combo()
+        index = self.merchant_combo.findData(merchant_id)
+        if index >= 0:
+            self.merchant_combo.setCurrentIndex(index)
 
         # Switch to terminals tab
         self.tab_widget.setCurrentIndex(1)
 
-    @pyqtSlot()
-    def edit_merchant(self):
-        button = self.sender()
-        merchant_id = button.property("merchant_id")
-
+    def edit_merchant(self, merchant_id):
         merchant = self.merchant_manager.get_merchant(merchant_id)
         if not merchant:
             QMessageBox.warning(self, "Error", "Merchant not found.")
@@ -717,15 +919,10 @@ class MerchantManagementWidget(QWidget):
             if success:
                 QMessageBox.information(self, "Success", "Merchant updated successfully.")
                 self.refresh_merchants_table()
-                self.refresh_merchant_combo()
             else:
                 QMessageBox.warning(self, "Error", "Failed to update merchant.")
 
-    @pyqtSlot()
-    def suspend_merchant(self):
-        button = self.sender()
-        merchant_id = button.property("merchant_id")
-
+    def suspend_merchant(self, merchant_id):
         confirm = QMessageBox.question(
             self,
             "Confirm Suspension",
@@ -742,11 +939,7 @@ class MerchantManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to suspend merchant.")
 
-    @pyqtSlot()
-    def activate_merchant(self):
-        button = self.sender()
-        merchant_id = button.property("merchant_id")
-
+    def activate_merchant(self, merchant_id):
         success = self.merchant_manager.change_merchant_status(merchant_id, MerchantStatus.ACTIVE)
 
         if success:
@@ -781,11 +974,7 @@ class MerchantManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to add terminal.")
 
-    @pyqtSlot()
-    def edit_terminal(self):
-        button = self.sender()
-        terminal_id = button.property("terminal_id")
-
+    def edit_terminal(self, terminal_id):
         terminal = self.merchant_manager.get_terminal(terminal_id)
         if not terminal:
             QMessageBox.warning(self, "Error", "Terminal not found.")
@@ -811,11 +1000,7 @@ class MerchantManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to update terminal.")
 
-    @pyqtSlot()
-    def delete_terminal(self):
-        button = self.sender()
-        terminal_id = button.property("terminal_id")
-
+    def delete_terminal(self, terminal_id):
         confirm = QMessageBox.question(
             self,
             "Confirm Deletion",
@@ -0,0 +1,98 @@
+from contextlib import contextmanager
+from functools import partial
+
+from PyQt6.QtWidgets import (
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton, QTableWidgetItem
+)
+from PyQt6.QtCore import Qt, QEvent, QRect, QSize, QTimer
+
+
+@contextmanager
+def batch_update(view):
+    """Suspend repaints, signals and sorting on ``view`` while it is repopulated."""
+    sorting_enabled = view.isSortingEnabled()
+    view.setUpdatesEnabled(False)
+    view.blockSignals(True)
+    view.setSortingEnabled(False)
+    try:
+        yield view
+    finally:
+        view.setSortingEnabled(sorting_enabled)
+        view.blockSignals(False)
+        view.setUpdatesEnabled(True)
+
+
+def set_cell(table, row, column, text):
+    """Set the text of a QTableWidget cell, reusing the item already there if any."""
+    item = table.item(row, column)
+    if item is None:
+        item = QTableWidgetItem(text)
+        table.setItem(row, column, item)
+    else:
+        item.setText(text)
+    return item
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """Paints a row's action buttons and dispatches their clicks.
+
+    One delegate serves a whole column, so rows carry no widgets of their
+    own. ``actions_for(index)`` returns ``[(label, handler), ...]`` for the
+    row; a clicked handler is called with the id stored under ``UserRole``
+    in column 0.
+    """
+
+    BUTTON_PADDING = 16
+    BUTTON_SPACING = 4
+
+    def __init__(self, actions_for, parent=None):
+        super().__init__(parent)
+        self._actions_for = actions_for
+
+    def _button_rects(self, option, labels):
+        metrics = option.fontMetrics
+        rect = option.rect
+        x = rect.left() + self.BUTTON_SPACING
+        rects = []
+        for label in labels:
+            width = metrics.horizontalAdvance(label) + self.BUTTON_PADDING
+            rects.append(QRect(x, rect.top() + 2, width, rect.height() - 4))
+            x += width + self.BUTTON_SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        labels = [label for label, _ in self._actions_for(index)]
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(labels, self._button_rects(option, labels)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        labels = [label for label, _ in self._actions_for(index)]
+        width = sum(option.fontMetrics.horizontalAdvance(label) + self.BUTTON_PADDING for label in labels)
+        width += self.BUTTON_SPACING * (len(labels) + 1)
+        return QSize(width, super().sizeHint(option, index).height())
+
+    def createEditor(self, parent, option, index):
+        # The cell only shows buttons; double-click, F2 or typing must not edit it
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            actions = self._actions_for(index)
+            rects = self._button_rects(option, [label for label, _ in actions])
+            pos = event.position().toPoint()
+            for (_, handler), rect in zip(actions, rects):
+                if rect.contains(pos):
+                    record_id = index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
+                    # Run the handler once the click is done; it may open a
+                    # dialog and reset the model this index belongs to
+                    QTimer.singleShot(0, partial(handler, record_id))
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,25 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class ManagerTask(QRunnable):
+    """Runs a blocking manager call on a thread pool.
+
+    The outcome is reported through ``signals.finished(ok, result)``; ``ok`` is
+    False when the call raised, in which case ``result`` holds the exception.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(bool, object)
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.finished.emit(False, e)
+            return
+        self.signals.finished.emit(True, result)
@@ -1,16 +1,266 @@
 import logging
+import os
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QComboBox, QDateEdit, QHeaderView, QTextEdit,
-    QFileDialog, QMessageBox, QTabWidget, QSplitter, QFrame
+    QTableWidget, QTableWidgetItem, QComboBox, QDateEdit, QHeaderView,
+    QFileDialog, QMessageBox, QTabWidget, QSplitter, QFrame, QTableView, QProgressDialog
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QDate, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QSignalBlocker, QThreadPool, QTimer
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QDate
 from PyQt6.QtGui import QColor
 
 from ..app.transaction_history import (
     TransactionManager, Transaction, TransactionType, TransactionStatus
 )
+from .table_utils import batch_update
+
+_RED = QColor(255, 0, 0)
+_GREEN = QColor(200, 255, 200)
+_REDBG = QColor(255, 200, 200)
+_YELLOW = QColor(255, 255, 200)
+
+_STATUS_BG = {
+    TransactionStatus.APPROVED: _GREEN,
+    TransactionStatus.SETTLED: _GREEN,
+    TransactionStatus.DECLINED: _REDBG,
+    TransactionStatus.FAILED: _REDBG,
+    TransactionStatus.DISPUTED: _YELLOW,
+}
+
+_ALIGN_R = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Amounts of these types are shown in red
+_NEGATIVE_TYPES = frozenset([TransactionType.REFUND, TransactionType.CHARGEBACK])
+
+
+class TransactionTableModel(QAbstractTableModel):
+    """Exposes the filtered transactions to a QTableView."""
+
+    HEADERS = ["Reference", "Date", "Card", "Merchant", "Amount", "Type", "Status", "Description"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # transaction id -> (updated_at, formatted cells), kept across filter changes
+        self._fmt_cache = {}
+
+    def set_transactions(self, transactions):
+        self.beginResetModel()
+        self._rows = list(transactions)
+        self.endResetModel()
+
+    def prune_cache(self, live_ids):
+        """Forget the formatted cells of transactions whose id is not in ``live_ids``."""
+        for transaction_id in self._fmt_cache.keys() - live_ids:
+            del self._fmt_cache[transaction_id]
+
+    def transaction_at(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def _display_row(self, transaction):
+        # updated_at changes whenever the transaction does; a mismatch means the
+        # cached text is stale and is overwritten below
+        cached = self._fmt_cache.get(transaction.id)
+        if cached is not None and cached[0] == transaction.updated_at:
+            cells = cached[1]
+        else:
+            cells = (
+                transaction.reference_id,
+                transaction.timestamp.strftime("%Y-%m-%d %H:%M"),
+                transaction.masked_card,
+                transaction.merchant,
+                f"${transaction.amount:.2f}",
+                transaction.transaction_type.value,
+                transaction.status.value,
+                transaction.description
+            )
+            self._fmt_cache[transaction.id] = (transaction.updated_at, cells)
+        return cells
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        transaction = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_row(transaction)[column]
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == 4:
+            return _ALIGN_R
+        elif role == Qt.ItemDataRole.ForegroundRole and column == 4:
+            if transaction.transaction_type in _NEGATIVE_TYPES:
+                return _RED
+        elif role == Qt.ItemDataRole.BackgroundRole and column == 6:
+            return _STATUS_BG.get(transaction.status)
+
+        return None
+
+
+def _build_sample_transactions():
+    # Sample transactions for demonstration
+    transactions = [
+        Transaction(
+            amount=125.50,
+            card_number="4111111111111111",
+            merchant="Online Store Inc.",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.APPROVED,
+            description="Purchase of electronics"
+        ),
+        Transaction(
+            amount=75.25,
+            card_number="5555555555554444",
+            merchant="Grocery Market",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.SETTLED,
+            description="Weekly groceries"
+        ),
+        Transaction(
+            amount=25.00,
+            card_number="4111111111111111",
+            merchant="Online Store Inc.",
+            transaction_type=TransactionType.REFUND,
+            status=TransactionStatus.REFUNDED,
+            description="Partial refund for returned item"
+        ),
+        Transaction(
+            amount=200.00,
+            card_number="378282246310005",
+            merchant="Travel Agency",
+            transaction_type=TransactionType.AUTHORIZATION,
+            status=TransactionStatus.PENDING,
+            description="Hotel reservation"
+        ),
+        Transaction(
+            amount=50.00,
+            card_number="6011111111111117",
+            merchant="Gas Station",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.APPROVED,
+            description="Fuel purchase"
+        ),
+        Transaction(
+            amount=350.75,
+            card_number="5555555555554444",
+            merchant="Department Store",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.DISPUTED,
+            description="Clothing purchase"
+        ),
+        Transaction(
+            amount=1200.00,
+            card_number="378282246310005",
+            merchant="Electronics Store",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.SETTLED,
+            description="New laptop"
+        ),
+        Transaction(
+            amount=15.99,
+            card_number="4111111111111111",
+            merchant="Streaming Service",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.SETTLED,
+            description="Monthly subscription"
+        ),
+        Transaction(
+            amount=350.75,
+            card_number="5555555555554444",
+            merchant="Department Store",
+            transaction_type=TransactionType.CHARGEBACK,
+            status=TransactionStatus.DISPUTED,
+            description="Customer dispute"
+        ),
+        Transaction(
+            amount=45.50,
+            card_number="6011111111111117",
+            merchant="Restaurant",
+            transaction_type=TransactionType.PAYMENT,
+            status=TransactionStatus.SETTLED,
+            description="Dinner"
+        )
+    ]
+
+    # Adjust timestamps to spread over the last 30 days
+    now = datetime.now()
+    for i, transaction in enumerate(transactions):
+        days_ago = i % 30
+        transaction.timestamp = now - timedelta(days=days_ago)
+        transaction.updated_at = transaction.timestamp
+
+    return transactions
+
+
+class SampleLoader(QRunnable):
+    """Builds the demonstration transactions on the global thread pool.
+
+    The finished list is handed back through ``signals.loaded``.
+    """
+
+    class Signals(QObject):
+        loaded = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+
+    def run(self):
+        self.signals.loaded.emit(_build_sample_transactions())
+
+
+class JsonImporter(QRunnable):
+    """Reads a transactions JSON file on the global thread pool.
+
+    Parsed transactions are handed back in chunks through
+    ``signals.chunkReady``; ``signals.finished(ok, result)`` ends the run with
+    the number of transactions read, or the exception when ``ok`` is False.
+    """
+
+    CHUNK_SIZE = 1000
+
+    class Signals(QObject):
+        chunkReady = pyqtSignal(list)
+        finished = pyqtSignal(bool, object)
+
+    def __init__(self, transaction_manager, file_path):
+        super().__init__()
+        self.transaction_manager = transaction_manager
+        self.file_path = file_path
+        self.signals = self.Signals()
+
+    def run(self):
+        count = 0
+        chunk = []
+        try:
+            for transaction in self.transaction_manager.iter_json_transactions(self.file_path):
+                chunk.append(transaction)
+                if len(chunk) >= self.CHUNK_SIZE:
+                    self.signals.chunkReady.emit(chunk)
+                    count += len(chunk)
+                    chunk = []
+        except Exception as e:
+            self.signals.finished.emit(False, e)
+            return
+
+        if chunk:
+            self.signals.chunkReady.emit(chunk)
+            count += len(chunk)
+        self.signals.finished.emit(True, count)
 
 
 class TransactionHistoryWidget(QWidget):
@@ -18,6 +268,15 @@ class TransactionHistoryWidget(QWidget):
         super().__init__(parent)
         self.logger = logging.getLogger("fintechx_desktop.ui.transaction_history")
         self.transaction_manager = TransactionManager()
+        self._merchants_version = -1
+        self._bounds_cache = None
+        self._sized_once = False
+
+        # Coalesce bursts of filter edits into one refresh
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self.refresh_transactions_table)
 
         main_layout = QVBoxLayout(self)
 
@@ -29,112 +288,30 @@ class TransactionHistoryWidget(QWidget):
         self.setup_transactions_list_tab()
         self.tab_widget.addTab(self.transactions_list_widget, "Transactions")
 
-        # Create the reporting tab
+        # The reporting tab starts empty and is filled in on first visit
         self.reporting_widget = QWidget()
-        self.setup_reporting_tab()
         self.tab_widget.addTab(self.reporting_widget, "Reports")
+        self._reporting_built = False
 
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
-        # Initialize with some sample data
-        self.load_sample_data()
+        self.tab_widget.currentChanged.connect(self._ensure_reporting_tab)
 
-    def load_sample_data(self):
-        # Add sample transactions for demonstration
-        transactions = [
-            Transaction(
-                amount=125.50,
-                card_number="4111111111111111",
-                merchant="Online Store Inc.",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.APPROVED,
-                description="Purchase of electronics"
-            ),
-            Transaction(
-                amount=75.25,
-                card_number="5555555555554444",
-                merchant="Grocery Market",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.SETTLED,
-                description="Weekly groceries"
-            ),
-            Transaction(
-                amount=25.00,
-                card_number="4111111111111111",
-                merchant="Online Store Inc.",
-                transaction_type=TransactionType.REFUND,
-                status=TransactionStatus.REFUNDED,
-                description="Partial refund for returned item"
-            ),
-            Transaction(
-                amount=200.00,
-                card_number="378282246310005",
-                merchant="Travel Agency",
-                transaction_type=TransactionType.AUTHORIZATION,
-                status=TransactionStatus.PENDING,
-                description="Hotel reservation"
-            ),
-            Transaction(
-                amount=50.00,
-                card_number="6011111111111117",
-                merchant="Gas Station",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.APPROVED,
-                description="Fuel purchase"
-            ),
-            Transaction(
-                amount=350.75,
-                card_number="5555555555554444",
-                merchant="Department Store",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.DISPUTED,
-                description="Clothing purchase"
-            ),
-            Transaction(
-                amount=1200.00,
-                card_number="378282246310005",
-                merchant="Electronics Store",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.SETTLED,
-                description="New laptop"
-            ),
-            Transaction(
-                amount=15.99,
-                card_number="4111111111111111",
-                merchant="Streaming Service",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.SETTLED,
-                description="Monthly subscription"
-            ),
-            Transaction(
-                amount=350.75,
-                card_number="5555555555554444",
-                merchant="Department Store",
-                transaction_type=TransactionType.CHARGEBACK,
-                status=TransactionStatus.DISPUTED,
-                description="Customer dispute"
-            ),
-            Transaction(
-                amount=45.50,
-                card_number="6011111111111117",
-                merchant="Restaurant",
-                transaction_type=TransactionType.PAYMENT,
-                status=TransactionStatus.SETTLED,
-                description="Dinner"
-            )
-        ]
+        # Demonstration data is only loaded when FINTECHX_DEMO is set
+        if os.environ.get("FINTECHX_DEMO"):
+            QTimer.singleShot(0, self.load_sample_data)
 
-        # Adjust timestamps to spread over the last 30 days
-        now = datetime.now()
-        for i, transaction in enumerate(transactions):
-            days_ago = i % 30
-            transaction.timestamp = now - timedelta(days=days_ago)
-            transaction.updated_at = transaction.timestamp
-            self.transaction_manager.add_transaction(transaction)
+    @pyqtSlot()
+    def load_sample_data(self):
+        loader = SampleLoader()
+        loader.signals.loaded.connect(self._on_sample_data_loaded)
+        QThreadPool.globalInstance().start(loader)
 
+    @pyqtSlot(list)
+    def _on_sample_data_loaded(self, transactions):
+        self.transaction_manager.bulk_add(transactions)
         self.refresh_transactions_table()
-        self.refresh_report_data()
 
     def setup_transactions_list_tab(self):
         layout = QVBoxLayout()
@@ -144,14 +321,14 @@ class TransactionHistoryWidget(QWidget):
         filter_layout = QHBoxLayout()
 
         self.status_filter = QComboBox()
-        self.status_filter.addItem("All Statuses")
+        self.status_filter.addItem("All Statuses", None)
         for status in TransactionStatus:
-            self.status_filter.addItem(status.value)
+            self.status_filter.addItem(status.value, status)
 
         self.type_filter = QComboBox()
-        self.type_filter.addItem("All Types")
+        self.type_filter.addItem("All Types", None)
         for t_type in TransactionType:
-            self.type_filter.addItem(t_type.value)
+            self.type_filter.addItem(t_type.value, t_type)
 
         self.date_from = QDateEdit()
         self.date_from.setCalendarPopup(True)
@@ -166,7 +343,9 @@ class TransactionHistoryWidget(QWidget):
         self.merchant_filter.addItem("All Merchants")
 
         self.apply_filter_button = QPushButton("Apply Filter")
-        self.apply_filter_button.clicked.connect(self.refresh_transactions_table)
+        self.apply_filter_button.clicked.connect(self._schedule_refresh)
+
+        self.merchant_filter.editTextChanged.connect(self._schedule_refresh)
 
         filter_layout.addWidget(QLabel("Status:"))
         filter_layout.addWidget(self.status_filter)
@@ -181,12 +360,11 @@ class TransactionHistoryWidget(QWidget):
         filter_layout.addWidget(self.apply_filter_button)
         filter_group.setLayout(filter_layout)
 
-        # Transactions table
-        self.transactions_table = QTableWidget(0, 8)
-        self.transactions_table.setHorizontalHeaderLabels([
-            "Reference", "Date", "Card", "Merchant", "Amount", "Type", "Status", "Description"
-        ])
-        self.transactions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Transactions table, backed by a model holding the filtered transactions
+        self.transactions_model = TransactionTableModel(self)
+        self.transactions_table = QTableView()
+        self.transactions_table.setModel(self.transactions_model)
+        self.transactions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.transactions_table.horizontalHeader().setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)
 
         # Action buttons
@@ -210,6 +388,15 @@ class TransactionHistoryWidget(QWidget):
 
         self.transactions_list_widget.setLayout(layout)
 
+    @pyqtSlot(int)
+    def _ensure_reporting_tab(self, index):
+        if index != 1 or self._reporting_built:
+            return
+
+        self.setup_reporting_tab()
+        self._reporting_built = True
+        self.generate_report()
+
     def setup_reporting_tab(self):
         layout = QVBoxLayout()
 
@@ -243,8 +430,10 @@ class TransactionHistoryWidget(QWidget):
         summary_layout = QVBoxLayout(summary_frame)
         summary_layout.addWidget(QLabel("<b>Transaction Summary</b>"))
 
-        self.summary_text = QTextEdit()
-        self.summary_text.setReadOnly(True)
+        self.summary_text = QLabel()
+        self.summary_text.setTextFormat(Qt.TextFormat.RichText)
+        self.summary_text.setWordWrap(True)
+        self.summary_text.setAlignment(Qt.AlignmentFlag.AlignTop)
         summary_layout.addWidget(self.summary_text)
 
         # Status distribution section
@@ -295,77 +484,72 @@ class TransactionHistoryWidget(QWidget):
         self.reporting_widget.setLayout(layout)
 
     @pyqtSlot()
-    def refresh_transactions_table(self):
-        self.transactions_table.setRowCount(0)
-
-        status_filter = self.status_filter.currentText()
-        type_filter = self.type_filter.currentText()
-        merchant_filter = self.merchant_filter.currentText()
-
-        from_date = self.date_from.date().toPyDate()
-        from_datetime = datetime.combine(from_date, datetime.min.time())
-
-        to_date = self.date_to.date().toPyDate()
-        to_datetime = datetime.combine(to_date, datetime.max.time())
-
-        transactions = self.transaction_manager.get_transactions_by_date_range(from_datetime, to_datetime)
-
-        if status_filter != "All Statuses":
-            transactions = [t for t in transactions if t.status.value == status_filter]
-
-        if type_filter != "All Types":
-            transactions = [t for t in transactions if t.transaction_type.value == type_filter]
-
-        if merchant_filter != "All Merchants":
-            transactions = [t for t in transactions if merchant_filter.lower() in t.merchant.lower()]
+    def _schedule_refresh(self):
+        self._filter_timer.start()
 
-        self.transactions_table.setRowCount(len(transactions))
+    def _filter_bounds(self):
+        # The datetime bounds are only rebuilt when one of the dates changes
+        from_qdate = self.date_from.date()
+        to_qdate = self.date_to.date()
 
-        for row, transaction in enumerate(transactions):
-            self.transactions_table.setItem(row, 0, QTableWidgetItem(transaction.reference_id))
+        cache = self._bounds_cache
+        if cache is None or cache[0] != from_qdate or cache[1] != to_qdate:
+            from_datetime = datetime.combine(from_qdate.toPyDate(), datetime.min.time())
+            to_datetime = datetime.combine(to_qdate.toPyDate(), datetime.max.time())
+            cache = self._bounds_cache = (from_qdate, to_qdate, from_datetime, to_datetime)
 
-            date_item = QTableWidgetItem(transaction.timestamp.strftime("%Y-%m-%d %H:%M"))
-            self.transactions_table.setItem(row, 1, date_item)
+        return cache[2], cache[3]
 
-            self.transactions_table.setItem(row, 2, QTableWidgetItem(transaction.masked_card))
-            self.transactions_table.setItem(row, 3, QTableWidgetItem(transaction.merchant))
-
-            amount_item = QTableWidgetItem(f"${transaction.amount:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-
-            if transaction.transaction_type in [TransactionType.REFUND, TransactionType.CHARGEBACK]:
-                amount_item.setForeground(QColor(255, 0, 0))  # Red for refunds/chargebacks
-            self.transactions_table.setItem(row, 4, amount_item)
-
-            type_item = QTableWidgetItem(transaction.transaction_type.value)
-            self.transactions_table.setItem(row, 5, type_item)
-
-            status_item = QTableWidgetItem(transaction.status.value)
-            if transaction.status == TransactionStatus.APPROVED or transaction.status == TransactionStatus.SETTLED:
-                status_item.setBackground(QColor(200, 255, 200))  # Light green
-            elif transaction.status == TransactionStatus.DECLINED or transaction.status == TransactionStatus.FAILED:
-                status_item.setBackground(QColor(255, 200, 200))  # Light red
-            elif transaction.status == TransactionStatus.DISPUTED:
-                status_item.setBackground(QColor(255, 255, 200))  # Light yellow
-            self.transactions_table.setItem(row, 6, status_item)
+    @pyqtSlot()
+    def refresh_transactions_table(self):
+        merchant_filter = self.merchant_filter.currentText()
 
-            self.transactions_table.setItem(row, 7, QTableWidgetItem(transaction.description))
+        from_datetime, to_datetime = self._filter_bounds()
 
-        # Update merchant filter dropdown with unique merchants
-        current_merchant = self.merchant_filter.currentText()
-        self.merchant_filter.clear()
-        self.merchant_filter.addItem("All Merchants")
+        transactions = self.transaction_manager.query(
+            from_datetime,
+            to_datetime,
+            status=self.status_filter.currentData(),
+            transaction_type=self.type_filter.currentData(),
+            merchant=merchant_filter if merchant_filter != "All Merchants" else None
+        )
 
-        merchants = set()
-        for transaction in self.transaction_manager.get_all_transactions():
-            merchants.add(transaction.merchant)
+        with batch_update(self.transactions_table):
+            self.transactions_model.set_transactions(transactions)
 
-        for merchant in sorted(merchants):
-            self.merchant_filter.addItem(merchant)
+        # Columns are fitted to the first real data only; after that they keep
+        # their widths instead of re-measuring every cell on each refresh
+        if transactions and not self._sized_once:
+            self.transactions_table.resizeColumnsToContents()
+            self._sized_once = True
 
-        index = self.merchant_filter.findText(current_merchant)
-        if index >= 0:
-            self.merchant_filter.setCurrentIndex(index)
+        # Update merchant filter dropdown, only when a new merchant has appeared
+        if self.transaction_manager.merchants_version == self._merchants_version:
+            return
+        self._merchants_version = self.transaction_manager.merchants_version
+
+        # Insert and remove only the merchants that differ; item 0 is "All Merchants".
+        # None of it must look like the user editing the filter.
+        combo = self.merchant_filter
+        current_merchant = combo.currentText()
+        with QSignalBlocker(combo):
+            pos = 1
+            for merchant in self.transaction_manager.sorted_merchants():
+                while pos < combo.count() and combo.itemText(pos) < merchant:
+                    combo.removeItem(pos)
+                if pos >= combo.count() or combo.itemText(pos) != merchant:
+                    combo.insertItem(pos, merchant)
+                pos += 1
+
+            while combo.count() > pos:
+                combo.removeItem(pos)
+
+            if combo.currentText() != current_merchant:
+                index = combo.findText(current_merchant)
+                if index >= 0:
+                    combo.setCurrentIndex(index)
+                else:
+                    combo.setEditText(current_merchant)
 
     @pyqtSlot()
     def export_transactions(self):
@@ -401,16 +585,42 @@ class TransactionHistoryWidget(QWidget):
         if not file_path:
             return
 
-        success = self.transaction_manager.import_from_json(file_path)
-
-        if success:
+        # The file is read on the thread pool; chunks are added here as they arrive
+        self._import_progress = QProgressDialog("Importing transactions...", None, 0, 0, self)
+        self._import_progress.setWindowTitle("Import Transactions")
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.show()
+        self._imported_count = 0
+
+        importer = JsonImporter(self.transaction_manager, file_path)
+        importer.signals.chunkReady.connect(self._on_import_chunk)
+        importer.signals.finished.connect(self._on_import_finished)
+        QThreadPool.globalInstance().start(importer)
+
+    @pyqtSlot(list)
+    def _on_import_chunk(self, transactions):
+        self.transaction_manager.bulk_add(transactions)
+        self._imported_count += len(transactions)
+        self._import_progress.setLabelText(f"Imported {self._imported_count} transactions...")
+
+    @pyqtSlot(bool, object)
+    def _on_import_finished(self, ok, result):
+        self._import_progress.close()
+        self._import_progress = None
+
+        if ok and result:
+            self.transactions_model.prune_cache(
+                {t.id for t in self.transaction_manager.get_all_transactions()}
+            )
             self.refresh_transactions_table()
             self.refresh_report_data()
             QMessageBox.information(
                 self, "Import Successful",
-                "Successfully imported transactions."
+                f"Successfully imported {result} transactions."
             )
         else:
+            if not ok:
+                self.logger.error(f"Failed to import transactions: {result}")
             QMessageBox.warning(
                 self, "Import Failed",
                 "Failed to import transactions. Please check the logs for details."
@@ -435,42 +645,38 @@ class TransactionHistoryWidget(QWidget):
         if 'message' in report:
             summary += f"<p>{report['message']}</p>"
 
-        self.summary_text.setHtml(summary)
-
-        # Update status distribution table
-        self.status_table.setRowCount(0)
-        if 'status_distribution' in report:
-            status_data = report['status_distribution']
-            self.status_table.setRowCount(len(status_data))
+        self.summary_text.setText(summary)
 
-            for row, (status, count) in enumerate(status_data.items()):
-                self.status_table.setItem(row, 0, QTableWidgetItem(status))
-                self.status_table.setItem(row, 1, QTableWidgetItem(str(count)))
+        # Update the distribution tables; each is sized once and filled through
+        # a bound setItem rather than cleared first and looked up per cell
+        status_data = report.get('status_distribution', {})
+        set_item = self.status_table.setItem
+        self.status_table.setRowCount(len(status_data))
+        for row, (status, count) in enumerate(status_data.items()):
+            set_item(row, 0, QTableWidgetItem(status))
+            set_item(row, 1, QTableWidgetItem(str(count)))
 
-        # Update type distribution table
-        self.type_table.setRowCount(0)
-        if 'type_distribution' in report:
-            type_data = report['type_distribution']
-            self.type_table.setRowCount(len(type_data))
-
-            for row, (type_name, count) in enumerate(type_data.items()):
-                self.type_table.setItem(row, 0, QTableWidgetItem(type_name))
-                self.type_table.setItem(row, 1, QTableWidgetItem(str(count)))
+        type_data = report.get('type_distribution', {})
+        set_item = self.type_table.setItem
+        self.type_table.setRowCount(len(type_data))
+        for row, (type_name, count) in enumerate(type_data.items()):
+            set_item(row, 0, QTableWidgetItem(type_name))
+            set_item(row, 1, QTableWidgetItem(str(count)))
 
         # Update merchant table
-        self.merchant_table.setRowCount(0)
-        if 'top_merchants' in report:
-            merchant_data = report['top_merchants']
-            self.merchant_table.setRowCount(len(merchant_data))
-
-            for row, (merchant, volume) in enumerate(merchant_data.items()):
-                self.merchant_table.setItem(row, 0, QTableWidgetItem(merchant))
-
-                volume_item = QTableWidgetItem(f"${volume:.2f}")
-                volume_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                if volume < 0:
-                    volume_item.setForeground(QColor(255, 0, 0))  # Red for negative values
-                self.merchant_table.setItem(row, 1, volume_item)
+        merchant_data = report.get('top_merchants', {})
+        set_item = self.merchant_table.setItem
+        self.merchant_table.setRowCount(len(merchant_data))
+        for row, (merchant, volume) in enumerate(merchant_data.items()):
+            set_item(row, 0, QTableWidgetItem(merchant))
+
+            volume_item = QTableWidgetItem(f"${volume:.2f}")
+            volume_item.setTextAlignment(_ALIGN_R)
+            if volume < 0:
+                volume_item.setForeground(_RED)  # Red for negative values
+            set_item(row, 1, volume_item)
 
     def refresh_report_data(self):
-        self.generate_report()
+        # Nothing to update until the reports tab has been opened
+        if self._reporting_built:
+            self.generate_report()
@@ -3,14 +3,176 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, QPushButton, QLabel,
     QTableWidget, QTableWidgetItem, QComboBox, QLineEdit, QHeaderView, QTextEdit,
     QMessageBox, QTabWidget, QDialog, QDialogButtonBox, QCheckBox, QGridLayout,
-    QListWidget, QListWidgetItem, QSplitter
+    QListWidget, QListWidgetItem, QSplitter, QTableView
 )
-from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import (
+    Qt, pyqtSlot, pyqtSignal, QAbstractTableModel, QModelIndex, QThreadPool, QTimer
+)
+from PyQt6.QtGui import QBrush, QColor
 
 from ..app.auth import (
     AuthManager, User, UserRole, Permission, RolePermissions
 )
+from .table_utils import ActionDelegate, batch_update
+from .tasks import ManagerTask
+
+LIGHT_GREEN = QColor(200, 255, 200)
+LIGHT_RED = QColor(255, 200, 200)
+
+# Status and granted-permission backgrounds
+_BRUSH_GREEN = QBrush(LIGHT_GREEN)
+_BRUSH_RED = QBrush(LIGHT_RED)
+
+_STATUS_STR = {
+    (True, False): "Active",
+    (True, True): "Active (Locked)",
+    (False, False): "Inactive",
+    (False, True): "Inactive (Locked)",
+}
+
+_GRANTED_TEXT = {True: "Yes", False: "No"}
+_GRANTED_BRUSH = {True: _BRUSH_GREEN, False: _BRUSH_RED}
+
+# Role lookup by display value, built once instead of scanning the enum each time
+ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
+
+# Action flags packed into the Actions cell; the delegate derives the buttons from them
+USER_ACTIVE = 0x1
+USER_LOCKED = 0x2
+
+ACTIONS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _user_actions(flags):
+    actions = []
+    if flags & USER_LOCKED:
+        actions.append(("Unlock", "unlock"))
+    elif flags & USER_ACTIVE:
+        actions.append(("Lock", "lock"))
+
+    if flags & USER_ACTIVE:
+        actions.append(("Deactivate", "deactivate"))
+    else:
+        actions.append(("Activate", "activate"))
+
+    actions.append(("Edit", "edit"))
+    return tuple(actions)
+
+
+# Every flag combination's buttons, worked out once instead of on each paint
+USER_ACTIONS = {flags: _user_actions(flags) for flags in range((USER_ACTIVE | USER_LOCKED) + 1)}
+
+
+def _user_snapshot(user):
+    # Everything a users table row shows, in a form cheap to compare
+    return (
+        user.username, user.full_name, user.email, user.role.value,
+        bool(user.active), user.is_locked(), user.last_login
+    )
+
+
+class _UserCache:
+    """Keeps the last ``get_all_users()`` result until the manager's revision moves on."""
+
+    def __init__(self, auth_manager):
+        self.auth_manager = auth_manager
+        self._users = None
+        self._revision = None
+
+    def get(self):
+        revision = self.auth_manager.revision
+        if self._users is None or revision != self._revision:
+            self._users = self.auth_manager.get_all_users()
+            self._revision = revision
+        return self._users
+
+
+class UsersTableModel(QAbstractTableModel):
+    """Exposes the filtered users to a QTableView.
+
+    Each row keeps the snapshot it was last shown with, so ``set_users`` can
+    repaint just the changed rows when the same users come back in the same
+    order.
+    """
+
+    HEADERS = ["Username", "Full Name", "Email", "Role", "Status", "Last Login", "Actions"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+        self._snapshots = []
+        self._display_rows = {}
+
+    def set_users(self, users):
+        users = list(users)
+        snapshots = [_user_snapshot(user) for user in users]
+
+        if [user.id for user in users] == [user.id for user in self._users]:
+            changed = [row for row, snapshot in enumerate(snapshots) if snapshot != self._snapshots[row]]
+            self._users = users
+            self._snapshots = snapshots
+            last_column = len(self.HEADERS) - 1
+            for row in changed:
+                self._display_rows.pop(row, None)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+            return
+
+        self.beginResetModel()
+        self._users = users
+        self._snapshots = snapshots
+        self._display_rows = {}
+        self.endResetModel()
+
+    def user_at(self, row):
+        return self._users[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._users)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def _display_row(self, row):
+        cells = self._display_rows.get(row)
+        if cells is None:
+            username, full_name, email, role_value, active, locked, last_login = self._snapshots[row]
+            cells = (
+                username,
+                full_name,
+                email,
+                role_value,
+                _STATUS_STR[(active, locked)],
+                last_login.strftime("%Y-%m-%d %H:%M") if last_login else "Never",
+                None
+            )
+            self._display_rows[row] = cells
+        return cells
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_row(row)[column]
+        elif role == Qt.ItemDataRole.BackgroundRole and column == 4:
+            active, locked = self._snapshots[row][4:6]
+            return _BRUSH_RED if not active or locked else _BRUSH_GREEN
+        elif role == ACTIONS_ROLE and column == 6:
+            active, locked = self._snapshots[row][4:6]
+            return (USER_ACTIVE if active else 0) | (USER_LOCKED if locked else 0)
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._users[row].id
+
+        return None
 
 
 class LoginDialog(QDialog):
@@ -19,6 +181,8 @@ class LoginDialog(QDialog):
     def __init__(self, auth_manager, parent=None):
         super().__init__(parent)
         self.auth_manager = auth_manager
+        self.logger = logging.getLogger("fintechx_desktop.ui.user_management")
+        self._auth_worker = None
         self.setWindowTitle("FinTechX Login")
         self.setMinimumWidth(400)
         self.setup_ui()
@@ -89,7 +253,26 @@ class LoginDialog(QDialog):
             self.show_error("Username and password are required.")
             return
 
-        session_id = self.auth_manager.authenticate(username, password)
+        # The check cannot be called back, so the dialog stays open until it answers
+        self.login_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.error_label.setVisible(False)
+
+        # Password hashing takes long enough to stall the UI, so it runs on the pool
+        self._auth_worker = ManagerTask(lambda: self.auth_manager.authenticate(username, password))
+        self._auth_worker.signals.finished.connect(self._on_authenticated)
+        QThreadPool.globalInstance().start(self._auth_worker)
+
+    @pyqtSlot(bool, object)
+    def _on_authenticated(self, ok, session_id):
+        self._auth_worker = None
+        self.login_button.setEnabled(True)
+        self.cancel_button.setEnabled(True)
+
+        if not ok:
+            self.logger.error(f"Authentication failed: {session_id}")
+            self.show_error("Authentication error.")
+            return
 
         if not session_id:
             self.show_error("Invalid username or password.")
@@ -103,6 +286,11 @@ class LoginDialog(QDialog):
         self.login_successful.emit(session_id, user.username)
         self.accept()
 
+    def reject(self):
+        # Escape and the close button end up here as well as Cancel
+        if self._auth_worker is None:
+            super().reject()
+
     def show_error(self, message):
         self.error_label.setText(message)
         self.error_label.setVisible(True)
@@ -157,12 +345,17 @@ class UserDetailsDialog(QDialog):
         permissions_group = QGroupBox("Custom Permissions")
         permissions_layout = QVBoxLayout()
 
+        # Items are kept by permission so check states never go through their text
         self.permissions_list = QListWidget()
+        self._perm_items = {}
+        checkable = Qt.ItemFlag.ItemIsUserCheckable
+        unchecked = Qt.CheckState.Unchecked
         for permission in Permission:
             item = QListWidgetItem(permission.value)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
+            item.setFlags(item.flags() | checkable)
+            item.setCheckState(unchecked)
             self.permissions_list.addItem(item)
+            self._perm_items[permission] = item
 
         permissions_layout.addWidget(self.permissions_list)
         permissions_group.setLayout(permissions_layout)
@@ -192,15 +385,9 @@ class UserDetailsDialog(QDialog):
             self.active_checkbox.setChecked(self.user.active)
 
             # Set custom permissions
-            for i in range(self.permissions_list.count()):
-                item = self.permissions_list.item(i)
-                perm_text = item.text()
-                try:
-                    permission = Permission(perm_text)
-                    if permission in self.user.custom_permissions:
-                        item.setCheckState(Qt.CheckState.Checked)
-                except ValueError:
-                    pass
+            checked = Qt.CheckState.Checked
+            for permission in self.user.custom_permissions or ():
+                self._perm_items[permission].setCheckState(checked)
 
     @pyqtSlot()
     def validate_and_accept(self):
@@ -230,21 +417,13 @@ class UserDetailsDialog(QDialog):
         self.accept()
 
     def get_user_data(self):
-        role = None
-        for r in UserRole:
-            if r.value == self.role_combo.currentText():
-                role = r
-                break
-
-        custom_permissions = set()
-        for i in range(self.permissions_list.count()):
-            item = self.permissions_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                try:
-                    permission = Permission(item.text())
-                    custom_permissions.add(permission)
-                except ValueError:
-                    pass
+        role = ROLE_BY_VALUE.get(self.role_combo.currentText())
+
+        checked = Qt.CheckState.Checked
+        custom_permissions = {
+            permission for permission, item in self._perm_items.items()
+            if item.checkState() == checked
+        }
 
         data = {
             "username": self.username_input.text().strip(),
@@ -267,6 +446,8 @@ class ChangePasswordDialog(QDialog):
         super().__init__(parent)
         self.auth_manager = auth_manager
         self.user_id = user_id
+        self.logger = logging.getLogger("fintechx_desktop.ui.user_management")
+        self._auth_worker = None
         self.setWindowTitle("Change Password")
         self.setup_ui()
 
@@ -289,11 +470,11 @@ class ChangePasswordDialog(QDialog):
 
         layout.addLayout(form_layout)
 
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        button_box.accepted.connect(self.validate_and_accept)
-        button_box.rejected.connect(self.reject)
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.validate_and_accept)
+        self.button_box.rejected.connect(self.reject)
 
-        layout.addWidget(button_box)
+        layout.addWidget(self.button_box)
 
     @pyqtSlot()
     def validate_and_accept(self):
@@ -313,20 +494,61 @@ class ChangePasswordDialog(QDialog):
             QMessageBox.warning(self, "Input Error", "New passwords do not match.")
             return
 
-        success = self.auth_manager.change_password(self.user_id, current_password, new_password)
+        # The change cannot be called back, so the dialog stays open until it answers
+        self.button_box.setEnabled(False)
+
+        self._auth_worker = ManagerTask(
+            lambda: self.auth_manager.change_password(self.user_id, current_password, new_password)
+        )
+        self._auth_worker.signals.finished.connect(self._on_password_changed)
+        QThreadPool.globalInstance().start(self._auth_worker)
+
+    @pyqtSlot(bool, object)
+    def _on_password_changed(self, ok, success):
+        self._auth_worker = None
+        self.button_box.setEnabled(True)
 
-        if not success:
+        if not ok:
+            self.logger.error(f"Password change failed: {success}")
+
+        if not ok or not success:
             QMessageBox.warning(self, "Error", "Failed to change password. Current password may be incorrect.")
             return
 
         self.accept()
 
+    def reject(self):
+        if self._auth_worker is None:
+            super().reject()
+
 
 class UserManagementWidget(QWidget):
     def __init__(self, auth_manager, parent=None):
         super().__init__(parent)
         self.auth_manager = auth_manager
         self.logger = logging.getLogger("fintechx_desktop.ui.user_management")
+        self._user_cache = _UserCache(auth_manager)
+        self._users_sized_once = False
+
+        # Action buttons for each flag combination, bound to their handlers once
+        handlers = {
+            "edit": self.edit_user,
+            "lock": self.lock_user,
+            "unlock": self.unlock_user,
+            "activate": self.activate_user,
+            "deactivate": self.deactivate_user,
+        }
+        self._actions_by_flags = {
+            flags: [(label, handlers[action]) for label, action in actions]
+            for flags, actions in USER_ACTIONS.items()
+        }
+
+        # Typing in the search box settles for a moment before the table is filtered
+        self._last_filter_key = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search)
 
         main_layout = QVBoxLayout(self)
 
@@ -338,11 +560,13 @@ class UserManagementWidget(QWidget):
         self.setup_users_list_tab()
         self.tab_widget.addTab(self.users_list_widget, "Users")
 
-        # Create the roles and permissions tab
+        # The roles and permissions tab starts empty and is filled in on first visit
         self.roles_permissions_widget = QWidget()
-        self.setup_roles_permissions_tab()
         self.tab_widget.addTab(self.roles_permissions_widget, "Roles & Permissions")
 
+        self._tabs_built = {0: True, 1: False}
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
@@ -363,6 +587,7 @@ class UserManagementWidget(QWidget):
 
         self.username_filter = QLineEdit()
         self.username_filter.setPlaceholderText("Search by username or name...")
+        self.username_filter.textChanged.connect(self._schedule_search)
 
         self.apply_filter_button = QPushButton("Apply Filter")
         self.apply_filter_button.clicked.connect(self.refresh_users_table)
@@ -376,14 +601,17 @@ class UserManagementWidget(QWidget):
         filter_layout.addWidget(self.apply_filter_button)
         filter_group.setLayout(filter_layout)
 
-        # Users table
-        self.users_table = QTableWidget(0, 7)
-        self.users_table.setHorizontalHeaderLabels([
-            "Username", "Full Name", "Email", "Role", "Status", "Last Login", "Actions"
-        ])
-        self.users_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Users table, backed by a model holding the filtered users
+        self.users_model = UsersTableModel(self)
+        self.users_table = QTableView()
+        self.users_table.setModel(self.users_model)
+        self.users_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.users_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
 
+        # One delegate paints every row's action buttons
+        self.user_actions_delegate = ActionDelegate(self._user_row_actions, self.users_table)
+        self.users_table.setItemDelegateForColumn(6, self.user_actions_delegate)
+
         # Action buttons
         action_layout = QHBoxLayout()
         self.refresh_button = QPushButton("Refresh")
@@ -401,8 +629,8 @@ class UserManagementWidget(QWidget):
 
         self.users_list_widget.setLayout(layout)
 
-        # Initial data load
-        self.refresh_users_table()
+        # Initial data load, once the widget has had a chance to paint
+        QTimer.singleShot(0, self.refresh_users_table)
 
     def setup_roles_permissions_tab(self):
         layout = QVBoxLayout()
@@ -425,11 +653,20 @@ class UserManagementWidget(QWidget):
         permissions_group = QGroupBox("Permissions")
         permissions_layout = QVBoxLayout()
 
-        self.permissions_table = QTableWidget(0, 2)
+        self.permissions_table = QTableWidget(len(Permission), 2)
         self.permissions_table.setHorizontalHeaderLabels(["Permission", "Granted"])
         self.permissions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.permissions_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
 
+        # The permission set is fixed, so the rows are built once and a role
+        # change only rewrites the Granted column
+        self._granted_items = []
+        for row, permission in enumerate(Permission):
+            self.permissions_table.setItem(row, 0, QTableWidgetItem(permission.value))
+            granted_item = QTableWidgetItem()
+            self.permissions_table.setItem(row, 1, granted_item)
+            self._granted_items.append(granted_item)
+
         permissions_layout.addWidget(self.permissions_table)
         permissions_group.setLayout(permissions_layout)
 
@@ -445,134 +682,79 @@ class UserManagementWidget(QWidget):
         if self.roles_list.count() > 0:
             self.roles_list.setCurrentRow(0)
 
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index):
+        if self._tabs_built.get(index, True):
+            return
+
+        if index == 1:
+            self.setup_roles_permissions_tab()
+        self._tabs_built[index] = True
+
     @pyqtSlot()
     def refresh_users_table(self):
-        self.users_table.setRowCount(0)
-
         role_filter = self.role_filter.currentText()
         status_filter = self.status_filter.currentText()
         search_text = self.username_filter.text().strip().lower()
+        self._last_filter_key = (role_filter, status_filter, search_text)
+
+        # All filters are applied in a single pass, cheapest checks first
+        role = ROLE_BY_VALUE.get(role_filter)
+        want_active = {"Active Only": True, "Inactive Only": False}.get(status_filter)
+        locked_only = status_filter == "Locked Users"
+
+        users = [
+            user for user in self._user_cache.get()
+            if (role is None or user.role is role)
+            and (want_active is None or bool(user.active) is want_active)
+            and (not locked_only or user.is_locked())
+            and (not search_text or search_text in user.search_text)
+        ]
+
+        with batch_update(self.users_table):
+            self.users_model.set_users(users)
+
+        # Columns are fitted to the first users shown instead of re-measuring
+        # every row whenever the model changes
+        if users and not self._users_sized_once:
+            self.users_table.resizeColumnsToContents()
+            self._users_sized_once = True
 
-        users = self.auth_manager.get_all_users()
-
-        # Apply role filter
-        if role_filter != "All Roles":
-            role = None
-            for r in UserRole:
-                if r.value == role_filter:
-                    role = r
-                    break
-            if role:
-                users = [u for u in users if u.role == role]
-
-        # Apply status filter
-        if status_filter == "Active Only":
-            users = [u for u in users if u.active]
-        elif status_filter == "Inactive Only":
-            users = [u for u in users if not u.active]
-        elif status_filter == "Locked Users":
-            users = [u for u in users if u.is_locked()]
-
-        # Apply search filter
-        if search_text:
-            filtered_users = []
-            for user in users:
-                if (search_text in user.username.lower() or
-                        search_text in user.first_name.lower() or
-                        search_text in user.last_name.lower() or
-                        search_text in user.full_name.lower()):
-                    filtered_users.append(user)
-            users = filtered_users
-
-        self.users_table.setRowCount(len(users))
-
-        for row, user in enumerate(users):
-            self.users_table.setItem(row, 0, QTableWidgetItem(user.username))
-            self.users_table.setItem(row, 1, QTableWidgetItem(user.full_name))
-            self.users_table.setItem(row, 2, QTableWidgetItem(user.email))
-            self.users_table.setItem(row, 3, QTableWidgetItem(user.role.value))
-
-            status_text = "Active" if user.active else "Inactive"
-            if user.is_locked():
-                status_text += " (Locked)"
-
-            status_item = QTableWidgetItem(status_text)
-            if not user.active or user.is_locked():
-                status_item.setBackground(QColor(255, 200, 200))  # Light red
-            else:
-                status_item.setBackground(QColor(200, 255, 200))  # Light green
-
-            self.users_table.setItem(row, 4, status_item)
-
-            last_login = user.last_login.strftime("%Y-%m-%d %H:%M") if user.last_login else "Never"
-            self.users_table.setItem(row, 5, QTableWidgetItem(last_login))
-
-            # Action buttons in a widget
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-
-            edit_button = QPushButton("Edit")
-            edit_button.setProperty("user_id", user.id)
-            edit_button.clicked.connect(self.edit_user)
-
-            if user.is_locked():
-                unlock_button = QPushButton("Unlock")
-                unlock_button.setProperty("user_id", user.id)
-                unlock_button.clicked.connect(self.unlock_user)
-                actions_layout.addWidget(unlock_button)
-            elif user.active:
-                lock_button = QPushButton("Lock")
-                lock_button.setProperty("user_id", user.id)
-                lock_button.clicked.connect(self.lock_user)
-                actions_layout.addWidget(lock_button)
-
-            if user.active:
-                deactivate_button = QPushButton("Deactivate")
-                deactivate_button.setProperty("user_id", user.id)
-                deactivate_button.clicked.connect(self.deactivate_user)
-                actions_layout.addWidget(deactivate_button)
-            else:
-                activate_button = QPushButton("Activate")
-                activate_button.setProperty("user_id", user.id)
-                activate_button.clicked.connect(self.activate_user)
-                actions_layout.addWidget(activate_button)
+    @pyqtSlot()
+    def _schedule_search(self):
+        self._search_timer.start()
 
-            actions_layout.addWidget(edit_button)
+    @pyqtSlot()
+    def _apply_search(self):
+        # Edits that only change case or surrounding spaces leave the results as they are
+        filter_key = (
+            self.role_filter.currentText(),
+            self.status_filter.currentText(),
+            self.username_filter.text().strip().lower()
+        )
+        if filter_key != self._last_filter_key:
+            self.refresh_users_table()
 
-            self.users_table.setCellWidget(row, 6, actions_widget)
+    def _user_row_actions(self, index):
+        return self._actions_by_flags[index.data(ACTIONS_ROLE)]
 
     @pyqtSlot(int)
     def update_permissions_view(self, row):
         if row < 0:
             return
 
-        role_text = self.roles_list.item(row).text()
-        role = None
-        for r in UserRole:
-            if r.value == role_text:
-                role = r
-                break
+        role = ROLE_BY_VALUE.get(self.roles_list.item(row).text())
 
         if not role:
             return
 
         permissions = RolePermissions.get_permissions_for_role(role)
 
-        self.permissions_table.setRowCount(len(Permission))
-
-        for row, permission in enumerate(Permission):
-            self.permissions_table.setItem(row, 0, QTableWidgetItem(permission.value))
-
-            granted = "Yes" if permission in permissions else "No"
-            granted_item = QTableWidgetItem(granted)
-
-            if granted == "Yes":
-                granted_item.setBackground(QColor(200, 255, 200))  # Light green
-            else:
-                granted_item.setBackground(QColor(255, 200, 200))  # Light red
-
-            self.permissions_table.setItem(row, 1, granted_item)
+        with batch_update(self.permissions_table):
+            for permission, granted_item in zip(Permission, self._granted_items):
+                granted = permission in permissions
+                granted_item.setText(_GRANTED_TEXT[granted])
+                granted_item.setBackground(_GRANTED_BRUSH[granted])
 
     @pyqtSlot()
     def add_new_user(self):
@@ -599,11 +781,7 @@ class UserManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to create user. Username or email may already exist.")
 
-    @pyqtSlot()
-    def edit_user(self):
-        button = self.sender()
-        user_id = button.property("user_id")
-
+    def edit_user(self, user_id):
         user = self.auth_manager.get_user(user_id)
         if not user:
             QMessageBox.warning(self, "Error", "User not found.")
@@ -630,11 +808,7 @@ class UserManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to update user.")
 
-    @pyqtSlot()
-    def lock_user(self):
-        button = self.sender()
-        user_id = button.property("user_id")
-
+    def lock_user(self, user_id):
         confirm = QMessageBox.question(
             self,
             "Confirm Lock",
@@ -651,11 +825,7 @@ class UserManagementWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Error", "Failed to lock user.")
 
-    @pyqtSlot()
-    def unlock_user(self):
-        button = self.sender()
-        user_id = button.property("user_id")
-
+    def unlock_user(self, user_id):
         success = self.auth_manager.unlock_user(user_id)
 
         if success:
@@ -664,11 +834,7 @@ class UserManagementWidget(QWidget):
         else:
             QMessageBox.warning(self, "Error", "Failed to unlock user.")
 
-    @pyqtSlot()
-    def activate_user(self):
-        button = self.sender()
-        user_id = button.property("user_id")
-
+    def activate_user(self, user_id):
         success = self.auth_manager.activate_user(user_id)
 
         if success:
@@ -677,11 +843,7 @@ class UserManagementWidget(QWidget):
         else:
             QMessageBox.warning(self, "Error", "Failed to activate user.")
 
-    @pyqtSlot()
-    def deactivate_user(self):
-        button = self.sender()
-        user_id = button.property("user_id")
-
+    def deactivate_user(self, user_id):
         confirm = QMessageBox.question(
             self,
             "Confirm Deactivation",